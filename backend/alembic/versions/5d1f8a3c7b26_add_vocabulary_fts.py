@@ -0,0 +1,49 @@
+"""Add vocabulary full-text index
+
+Revision ID: 5d1f8a3c7b26
+Revises: e3a8b6d0c512
+Create Date: 2026-10-17 19:05:12.448031
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '5d1f8a3c7b26'
+down_revision: Union[str, None] = 'e3a8b6d0c512'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # External-content FTS5 index, kept in sync with vocabulary by triggers
+    op.execute(
+        "CREATE VIRTUAL TABLE vocabulary_fts USING fts5("
+        "word, meaning, content='vocabulary', content_rowid='id', "
+        "tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+    )
+    op.execute(
+        "CREATE TRIGGER vocabulary_fts_ai AFTER INSERT ON vocabulary BEGIN "
+        "INSERT INTO vocabulary_fts(rowid, word, meaning) VALUES (new.id, new.word, new.meaning); END"
+    )
+    op.execute(
+        "CREATE TRIGGER vocabulary_fts_ad AFTER DELETE ON vocabulary BEGIN "
+        "INSERT INTO vocabulary_fts(vocabulary_fts, rowid, word, meaning) VALUES ('delete', old.id, old.word, old.meaning); END"
+    )
+    op.execute(
+        "CREATE TRIGGER vocabulary_fts_au AFTER UPDATE OF word, meaning ON vocabulary BEGIN "
+        "INSERT INTO vocabulary_fts(vocabulary_fts, rowid, word, meaning) VALUES ('delete', old.id, old.word, old.meaning); "
+        "INSERT INTO vocabulary_fts(rowid, word, meaning) VALUES (new.id, new.word, new.meaning); END"
+    )
+    # Index the existing vocabularies
+    op.execute("INSERT INTO vocabulary_fts(vocabulary_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER vocabulary_fts_au")
+    op.execute("DROP TRIGGER vocabulary_fts_ad")
+    op.execute("DROP TRIGGER vocabulary_fts_ai")
+    op.execute("DROP TABLE vocabulary_fts")
@@ -0,0 +1,89 @@
+"""Add vocabulary normalized word
+
+Revision ID: 7a4c2e9d1b58
+Revises: 5d1f8a3c7b26
+Create Date: 2026-10-17 19:48:30.215764
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = '7a4c2e9d1b58'
+down_revision: Union[str, None] = '5d1f8a3c7b26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STAT_COLUMNS = ('associations', 'played', 'correct', 'incorrect', 'mastered')
+
+# Rebuilding vocabulary in batch mode drops its triggers, see 5d1f8a3c7b26
+FTS_TRIGGERS = (
+    "CREATE TRIGGER vocabulary_fts_ai AFTER INSERT ON vocabulary BEGIN "
+    "INSERT INTO vocabulary_fts(rowid, word, meaning) VALUES (new.id, new.word, new.meaning); END",
+    "CREATE TRIGGER vocabulary_fts_ad AFTER DELETE ON vocabulary BEGIN "
+    "INSERT INTO vocabulary_fts(vocabulary_fts, rowid, word, meaning) VALUES ('delete', old.id, old.word, old.meaning); END",
+    "CREATE TRIGGER vocabulary_fts_au AFTER UPDATE OF word, meaning ON vocabulary BEGIN "
+    "INSERT INTO vocabulary_fts(vocabulary_fts, rowid, word, meaning) VALUES ('delete', old.id, old.word, old.meaning); "
+    "INSERT INTO vocabulary_fts(rowid, word, meaning) VALUES (new.id, new.word, new.meaning); END",
+)
+
+
+def normalize_word(word: str) -> str:
+    # Same as app.models.normalize_word at the time of writing
+    return word.strip().casefold()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('vocabulary', sa.Column('normalized_word', sa.String(length=50), nullable=True))
+
+    # Merge duplicates into the oldest vocabulary of each normalized word,
+    # moving their associations and learning statistics over
+    vocabulary = sa.table('vocabulary', sa.column('id', sa.Integer), sa.column('word', sa.String),
+                          sa.column('normalized_word', sa.String))
+    association = sa.table('association', sa.column('vocabulary_id', sa.Integer))
+    vocabulary_stats = sa.table('vocabulary_stats', sa.column('vocabulary_id', sa.Integer),
+                                *(sa.column(name, sa.Integer) for name in STAT_COLUMNS))
+    connection = op.get_bind()
+    keepers = {}
+    for vocabulary_id, word in connection.execute(sa.select(vocabulary.c.id, vocabulary.c.word).order_by(vocabulary.c.id)):
+        key = normalize_word(word)
+        keeper_id = keepers.setdefault(key, vocabulary_id)
+        if keeper_id == vocabulary_id:
+            continue
+        connection.execute(association.update().where(association.c.vocabulary_id == vocabulary_id).values(vocabulary_id=keeper_id))
+        duplicate_stats = connection.execute(
+            sa.select(*(vocabulary_stats.c[name] for name in STAT_COLUMNS)).where(vocabulary_stats.c.vocabulary_id == vocabulary_id)
+        ).first()
+        if duplicate_stats is not None:
+            connection.execute(vocabulary_stats.update().where(vocabulary_stats.c.vocabulary_id == keeper_id).values({
+                name: vocabulary_stats.c[name] + value for name, value in zip(STAT_COLUMNS, duplicate_stats)
+            }))
+            connection.execute(vocabulary_stats.delete().where(vocabulary_stats.c.vocabulary_id == vocabulary_id))
+        connection.execute(vocabulary.delete().where(vocabulary.c.id == vocabulary_id))
+    if keepers:
+        connection.execute(
+            vocabulary.update().where(vocabulary.c.id == sa.bindparam('b_id')).values(normalized_word=sa.bindparam('b_normalized_word')),
+            [{'b_id': vocabulary_id, 'b_normalized_word': key} for key, vocabulary_id in keepers.items()],
+        )
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('vocabulary', schema=None) as batch_op:
+        batch_op.alter_column('normalized_word', existing_type=sa.String(length=50), nullable=False)
+        batch_op.create_index(batch_op.f('ix_vocabulary_normalized_word'), ['normalized_word'], unique=True)
+    # ### end Alembic commands ###
+    for statement in FTS_TRIGGERS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # ### commands auto generated by Alembic - please adjust! ###
+    with op.batch_alter_table('vocabulary', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_vocabulary_normalized_word'))
+        batch_op.drop_column('normalized_word')
+    # ### end Alembic commands ###
+    for statement in FTS_TRIGGERS:
+        op.execute(statement)
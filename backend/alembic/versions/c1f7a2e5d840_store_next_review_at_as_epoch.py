@@ -0,0 +1,42 @@
+"""Store next_review_at as epoch seconds
+
+Revision ID: c1f7a2e5d840
+Revises: b6e0d4f2a913
+Create Date: 2026-10-17 21:47:03.118452
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c1f7a2e5d840'
+down_revision: Union[str, None] = 'b6e0d4f2a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name == 'sqlite':
+        # Convert the stored text first: the batch copy would CAST '2026-...' to 2026.0
+        op.execute("UPDATE association SET next_review_at = (julianday(next_review_at) - 2440587.5) * 86400.0")
+    with op.batch_alter_table('association', schema=None) as batch_op:
+        batch_op.alter_column('next_review_at',
+               existing_type=sa.DateTime(),
+               type_=sa.Float(),
+               existing_nullable=False,
+               postgresql_using='extract(epoch from next_review_at)')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('association', schema=None) as batch_op:
+        batch_op.alter_column('next_review_at',
+               existing_type=sa.Float(),
+               type_=sa.DateTime(),
+               existing_nullable=False,
+               postgresql_using="to_timestamp(next_review_at) at time zone 'UTC'")
+    if op.get_bind().dialect.name == 'sqlite':
+        op.execute("UPDATE association SET next_review_at = strftime('%Y-%m-%d %H:%M:%f', next_review_at, 'unixepoch')")
@@ -0,0 +1,86 @@
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from typing import Optional
+import threading
+import time
+
+from sqlalchemy import event, inspect
+
+from app.core.cache import CacheStats
+from app.core.config import settings
+from app.models import User
+
+
+@dataclass(frozen=True)
+class AuthUser:
+    """The fields of a user that authentication and authorization need"""
+    id: int
+    email: str
+    is_active: bool
+    is_superuser: bool
+
+
+class UserCache:
+    """Short-lived in-process cache of authenticated users, keyed by email.
+
+    Keeps the user lookup off the database for every authenticated request.
+    Changes made through the ORM invalidate the entry in this process; other
+    worker processes see them once their entry expires.
+    """
+
+    def __init__(self, ttl_seconds: int, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = CacheStats()
+        self._entries: OrderedDict[str, tuple[AuthUser, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, email: str) -> Optional[AuthUser]:
+        with self._lock:
+            entry = self._entries.get(email)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            user, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[email]
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(email)
+            self.stats.hits += 1
+            return user
+
+    def set(self, user: User) -> AuthUser:
+        auth_user = AuthUser(id=user.id, email=user.email, is_active=user.is_active, is_superuser=user.is_superuser)
+        if self.ttl_seconds <= 0:
+            return auth_user
+        with self._lock:
+            self._entries.pop(user.email, None)
+            self._entries[user.email] = (auth_user, time.monotonic() + self.ttl_seconds)
+            self.stats.sets += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+        return auth_user
+
+    def invalidate(self, email: str) -> None:
+        with self._lock:
+            self._entries.pop(email, None)
+            self.stats.deletes += 1
+
+    def get_stats(self) -> dict:
+        stats = asdict(self.stats)
+        stats.update(entries=len(self._entries), max_entries=self.max_entries)
+        return stats
+
+
+user_cache = UserCache(ttl_seconds=settings.USER_CACHE_TTL_SECONDS, max_entries=settings.USER_CACHE_MAX_ENTRIES)
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def invalidate_changed_user(mapper, connection, target: User) -> None:
+    user_cache.invalidate(target.email)
+    # A changed email leaves an entry under the old address behind
+    for email in inspect(target).attrs.email.history.deleted or ():
+        user_cache.invalidate(email)
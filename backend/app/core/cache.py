@@ -0,0 +1,307 @@
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from datetime import timedelta
+from typing import Optional
+import threading
+import time
+
+from fastapi import Request
+from momento import CacheClientAsync, Configurations, CredentialProvider
+from momento.responses import CacheGet, CacheSet, CacheDelete, CreateCache
+
+from app.core.config import settings
+
+
+# Cache name constant
+ASSOCIATIONS_CACHE_NAME = "user_associations"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    deletes: int = 0
+    evictions: int = 0
+    errors: int = 0
+
+
+class CacheBackend(ABC):
+    """Byte-oriented key/value cache used by the API handlers.
+
+    Backends never raise on lookup failures: a broken cache is reported as a
+    miss so handlers always fall back to the database. Operations are
+    coroutines so a network tier never blocks the event loop.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        ...
+
+    async def get_shared(self, key: str) -> Optional[bytes]:
+        """Like :meth:`get`, but never answered by a tier local to this process"""
+        return await self.get(key)
+
+    async def set_shared(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        """Like :meth:`set`, but never stored in a tier local to this process"""
+        await self.set(key, value, ttl_seconds)
+
+    def get_stats(self) -> dict:
+        return asdict(self.stats)
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryCache(CacheBackend):
+    """In-process LRU cache with a per-entry TTL and a total size cap in bytes.
+
+    Used on its own for tests and offline runs, and as the L1 tier in front
+    of Momento.
+    """
+
+    def __init__(self, max_bytes: int, default_ttl_seconds: int):
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.default_ttl_seconds = default_ttl_seconds
+        self.size_bytes = 0
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _entry_size(key: str, value: bytes) -> int:
+        return len(key) + len(value)
+
+    def _pop(self, key: str) -> None:
+        value, _ = self._entries.pop(key)
+        self.size_bytes -= self._entry_size(key, value)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._pop(key)
+                self.stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        size = self._entry_size(key, value)
+        if size > self.max_bytes:
+            # Never let one oversized value flush the whole tier
+            await self.delete(key)
+            return
+        ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self.size_bytes += size
+            self.stats.sets += 1
+            while self.size_bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._pop(oldest)
+                self.stats.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self.stats.deletes += 1
+
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        stats.update(entries=len(self._entries), size_bytes=self.size_bytes, max_bytes=self.max_bytes)
+        return stats
+
+
+class MomentoCache(CacheBackend):
+    """Momento-backed cache. Shared between every worker and instance."""
+
+    def __init__(self, client: CacheClientAsync, cache_name: str):
+        super().__init__()
+        self.client = client
+        self.cache_name = cache_name
+
+    async def get(self, key: str) -> Optional[bytes]:
+        resp = await self.client.get(self.cache_name, key)
+        match resp:
+            case CacheGet.Hit():
+                self.stats.hits += 1
+                return resp.value_bytes
+            case CacheGet.Miss():
+                self.stats.misses += 1
+                return None
+            case CacheGet.Error() as error:
+                print(f"Momento cache error: {error.message}. Falling back to database.")
+                self.stats.errors += 1
+                return None
+            case _:
+                print("Unreachable cache state. Falling back to database.")
+                self.stats.errors += 1
+                return None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        ttl = None if ttl_seconds is None else timedelta(seconds=ttl_seconds)
+        resp = await self.client.set(self.cache_name, key, value, ttl)
+        match resp:
+            case CacheSet.Success():
+                self.stats.sets += 1
+            case CacheSet.Error() as error:
+                print(f"Momento cache error: {error.message}")
+                self.stats.errors += 1
+
+    async def delete(self, key: str) -> None:
+        resp = await self.client.delete(self.cache_name, key)
+        match resp:
+            case CacheDelete.Success():
+                self.stats.deletes += 1
+            case CacheDelete.Error() as error:
+                print(f"Momento cache error: {error.message}")
+                self.stats.errors += 1
+
+    async def close(self) -> None:
+        # The async client has no close(), leaving its context closes the channels
+        await self.client.__aexit__(None, None, None)
+
+
+class TieredCache(CacheBackend):
+    """Read-through L1/L2 cache.
+
+    L1 is local to the worker process, so its TTL should stay short: a write
+    handled by another worker only invalidates L2 and this worker's L1 entry
+    lives on until it expires. Keys that must be seen by every worker at
+    once, like namespace versions, go through ``get_shared``/``set_shared``
+    and skip L1.
+    """
+
+    def __init__(self, l1: CacheBackend, l2: CacheBackend):
+        super().__init__()
+        self.l1 = l1
+        self.l2 = l2
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = await self.l1.get(key)
+        if value is not None:
+            self.stats.hits += 1
+            return value
+        value = await self.l2.get(key)
+        if value is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        await self.l1.set(key, value)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        await self.l2.set(key, value, ttl_seconds)
+        await self.l1.set(key, value)
+        self.stats.sets += 1
+
+    async def delete(self, key: str) -> None:
+        await self.l1.delete(key)
+        await self.l2.delete(key)
+        self.stats.deletes += 1
+
+    async def get_shared(self, key: str) -> Optional[bytes]:
+        return await self.l2.get(key)
+
+    async def set_shared(self, key: str, value: bytes, ttl_seconds: Optional[int] = None) -> None:
+        await self.l2.set(key, value, ttl_seconds)
+
+    def get_stats(self) -> dict:
+        stats = super().get_stats()
+        stats.update(l1=self.l1.get_stats(), l2=self.l2.get_stats())
+        return stats
+
+    async def close(self) -> None:
+        await self.l1.close()
+        await self.l2.close()
+
+
+async def get_namespace_version(cache: CacheBackend, namespace: str) -> str:
+    """Current version tag of a group of keys that is invalidated as a whole.
+
+    Keys built from the tag (e.g. one per page of a listing) are all dropped
+    by :func:`invalidate_namespace` without having to know them; the orphaned
+    entries simply expire. The tag itself lives on the shared tier only: an
+    L1 copy would keep other workers on the old version after a write.
+    """
+    version_key = f"{namespace}_version"
+    version = await cache.get_shared(version_key)
+    if version is None:
+        version = str(time.time_ns()).encode()
+        await cache.set_shared(version_key, version)
+    return version.decode()
+
+
+async def invalidate_namespace(cache: CacheBackend, namespace: str) -> None:
+    await cache.delete(f"{namespace}_version")
+
+
+async def create_momento_client() -> CacheClientAsync:
+    """Build the process-wide Momento client.
+
+    The client owns a pool of gRPC channels and is safe to share between
+    concurrent requests, so it is created once per worker process in the
+    application lifespan and reused for every request.
+    """
+    credential_provider = CredentialProvider.from_string(settings.MOMENTO_API_KEY)
+    configuration = Configurations.Laptop.v1().with_client_timeout(
+        timedelta(seconds=settings.MOMENTO_CLIENT_TIMEOUT_SECONDS)
+    )
+    config = {
+        'configuration': configuration,
+        'credential_provider': credential_provider,
+        'default_ttl': timedelta(seconds=settings.MOMENTO_TTL_SECONDS),
+        'eager_connection_timeout': timedelta(seconds=settings.MOMENTO_EAGER_CONNECTION_TIMEOUT_SECONDS),
+    }
+    return await CacheClientAsync.create(**config)
+
+
+async def create_caches(client: CacheClientAsync) -> None:
+    resp = await client.create_cache(ASSOCIATIONS_CACHE_NAME)
+    match resp:
+        case CreateCache.Success() | CreateCache.CacheAlreadyExists():
+            print(f"Momento cache '{ASSOCIATIONS_CACHE_NAME}' created or already exists.")
+        case CreateCache.Error() as error:
+            print(f"Error creating Momento cache: {error.message}")
+        case _:
+            print("Unreachable error state")
+
+
+async def create_cache_backend() -> CacheBackend:
+    """Build the cache configured by ``settings.CACHE_BACKEND``.
+
+    ``memory`` runs fully in-process with no network access, ``momento``
+    puts the in-process L1 tier in front of Momento.
+    """
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCache(max_bytes=settings.CACHE_L1_MAX_BYTES, default_ttl_seconds=settings.MOMENTO_TTL_SECONDS)
+
+    l1 = MemoryCache(max_bytes=settings.CACHE_L1_MAX_BYTES, default_ttl_seconds=settings.CACHE_L1_TTL_SECONDS)
+    client = await create_momento_client()
+    await create_caches(client)
+    return TieredCache(l1=l1, l2=MomentoCache(client, ASSOCIATIONS_CACHE_NAME))
+
+
+def get_cache(request: Request) -> CacheBackend:
+    return request.app.state.cache
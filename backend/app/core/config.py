@@ -6,8 +6,28 @@ from decouple import config
 class Settings(BaseSettings):
     SECRET_KEY: str = config('SECRET_KEY')
     # DATABASE_URL: PostgresDsn = config('DATABASE_URL')
-    MOMENTO_API_KEY: str = config('MOMENTO_API_KEY')
+    MOMENTO_API_KEY: str = config('MOMENTO_API_KEY', default='')
     MOMENTO_TTL_SECONDS: int = config('MOMENTO_TTL_SECONDS', cast=int, default=600)
+    MOMENTO_CLIENT_TIMEOUT_SECONDS: int = config('MOMENTO_CLIENT_TIMEOUT_SECONDS', cast=int, default=15)
+    MOMENTO_EAGER_CONNECTION_TIMEOUT_SECONDS: int = config('MOMENTO_EAGER_CONNECTION_TIMEOUT_SECONDS', cast=int, default=30)
+    CACHE_BACKEND: str = config('CACHE_BACKEND', default='momento')
+    CACHE_L1_MAX_BYTES: int = config('CACHE_L1_MAX_BYTES', cast=int, default=16 * 1024 * 1024)
+    CACHE_L1_TTL_SECONDS: int = config('CACHE_L1_TTL_SECONDS', cast=int, default=30)
+    BULK_INSERT_CHUNK_SIZE: int = config('BULK_INSERT_CHUNK_SIZE', cast=int, default=500)
+    ASSOCIATION_GENERATION_CONCURRENCY: int = config('ASSOCIATION_GENERATION_CONCURRENCY', cast=int, default=8)
+    JOB_WORKERS: int = config('JOB_WORKERS', cast=int, default=4)
+    JOB_POLL_INTERVAL_SECONDS: float = config('JOB_POLL_INTERVAL_SECONDS', cast=float, default=1.0)
+    JOB_LEASE_SECONDS: int = config('JOB_LEASE_SECONDS', cast=int, default=300)
+    JOB_MAX_ATTEMPTS: int = config('JOB_MAX_ATTEMPTS', cast=int, default=3)
+    JOB_RETRY_BACKOFF_SECONDS: float = config('JOB_RETRY_BACKOFF_SECONDS', cast=float, default=10.0)
+    GENERATION_CACHE_VARIANTS: int = config('GENERATION_CACHE_VARIANTS', cast=int, default=1)
+    GENERATION_CACHE_MAX_AGE_DAYS: int = config('GENERATION_CACHE_MAX_AGE_DAYS', cast=int, default=0)
+    GENERATION_BATCH_SIZE: int = config('GENERATION_BATCH_SIZE', cast=int, default=10)
+    GENERATION_BATCH_RETRIES: int = config('GENERATION_BATCH_RETRIES', cast=int, default=1)
+    USER_CACHE_TTL_SECONDS: int = config('USER_CACHE_TTL_SECONDS', cast=int, default=30)
+    USER_CACHE_MAX_ENTRIES: int = config('USER_CACHE_MAX_ENTRIES', cast=int, default=10000)
+    PASSWORD_HASH_ROUNDS: int = config('PASSWORD_HASH_ROUNDS', cast=int, default=29000)
+    PASSWORD_HASH_WORKERS: int = config('PASSWORD_HASH_WORKERS', cast=int, default=4)
     GEMINI_API_KEY: str = config('GEMINI_API_KEY')
     
 settings = Settings()  # type: ignore    
\ No newline at end of file
@@ -1,22 +1,25 @@
 # from sqlmodel import create_engine, Session, SQLModel
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from app.models import Base
 
 from decouple import config
 
 
-sqlite_file_name = config("CHAPERONE_SQLITE_FILE_NAME")
-sqlite_url = f"sqlite:///{sqlite_file_name}"
+sqlite_file_name = config("CHAPERONE_SQLITE_FILE_NAME", default="chaperone.db")
+database_url = config("DATABASE_URL", default=f"sqlite+aiosqlite:///{sqlite_file_name}")
 
-connect_args = {"check_same_thread": False}
-engine = create_engine(sqlite_url, echo=True)
+engine = create_async_engine(database_url, echo=True)
 
+# Objects stay usable after commit so handlers can serialize them without
+# another round trip; anything not loaded up front must be eager-loaded.
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-def create_db_and_tables():
-    Base.metadata.create_all(engine)
+
+async def create_db_and_tables():
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
     
     
-def get_session():
-    with Session(engine) as session:
+async def get_session():
+    async with async_session() as session:
         yield session
@@ -0,0 +1,136 @@
+from datetime import timedelta
+from typing import Awaitable, Callable, Optional
+import asyncio
+
+from fastapi import Request
+from sqlalchemy import select, update, or_, and_
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models import Job, JobStatus, utcnow
+
+
+JobHandler = Callable[[AsyncSession, Job], Awaitable[dict]]
+AfterCommit = Callable[[Job], Awaitable[None]]
+
+
+class JobQueue:
+    """Database-backed job queue with an in-process worker pool.
+
+    Jobs live in the ``job`` table, so their status is visible from every
+    worker process and survives restarts. Each process runs its own pool of
+    asyncio workers which claim jobs with a single atomic UPDATE. A job whose
+    worker died is claimed again once its lease expires.
+
+    Handlers must not commit: the handler's writes and the job's final state
+    are committed together, then ``after_commit`` runs. A failed attempt,
+    commit included, is retried after an exponential backoff until
+    ``max_attempts``. Workers log and survive every error; a job whose
+    failure could not even be recorded is picked up again after its lease.
+    """
+
+    def __init__(self, session_factory: async_sessionmaker, workers: int, poll_interval_seconds: float,
+                 lease_seconds: int, max_attempts: int, retry_backoff_seconds: float):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.poll_interval_seconds = poll_interval_seconds
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self._handlers: dict[str, tuple[JobHandler, Optional[AfterCommit]]] = {}
+        self._tasks: list[asyncio.Task] = []
+        self._wakeup = asyncio.Event()
+
+    def register(self, kind: str, handler: JobHandler, after_commit: Optional[AfterCommit] = None) -> None:
+        self._handlers[kind] = (handler, after_commit)
+
+    async def enqueue(self, session: AsyncSession, kind: str, payload: dict, user_id: int) -> Job:
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind '{kind}'")
+        job = Job(kind=kind, payload=payload, user_id=user_id, status=JobStatus.QUEUED)
+        session.add(job)
+        await session.commit()
+        self._wakeup.set()
+        return job
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._work()) for _ in range(self.workers)]
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                job_id = await self._claim()
+                if job_id is not None:
+                    await self._run(job_id)
+                    continue
+            except Exception as error:
+                # E.g. "database is locked": keep the worker, try again after a pause
+                print(f"Job worker error: {error!r}")
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.poll_interval_seconds)
+            except TimeoutError:
+                pass
+
+    async def _claim(self) -> Optional[int]:
+        now = utcnow()
+        claimable = select(Job.id).where(
+            or_(
+                and_(Job.status == JobStatus.QUEUED, or_(Job.not_before.is_(None), Job.not_before <= now)),
+                and_(Job.status == JobStatus.RUNNING, Job.claimed_at < now - timedelta(seconds=self.lease_seconds)),
+            )
+        ).order_by(Job.id).limit(1).scalar_subquery()
+        async with self.session_factory() as session:
+            job_id = await session.scalar(
+                update(Job).where(Job.id == claimable).values(
+                    status=JobStatus.RUNNING, claimed_at=now, attempts=Job.attempts + 1, updated_at=now
+                ).returning(Job.id).execution_options(synchronize_session=False)
+            )
+            await session.commit()
+        return job_id
+
+    async def _run(self, job_id: int) -> None:
+        async with self.session_factory() as session:
+            job = await session.get(Job, job_id)
+            # Rolling back expires the job, so remember what is needed first
+            kind, attempts = job.kind, job.attempts
+            handler, after_commit = self._handlers.get(kind, (None, None))
+            try:
+                if handler is None:
+                    raise ValueError(f"No handler registered for job kind '{kind}'")
+                job.result = await handler(session, job)
+                job.status = JobStatus.SUCCEEDED
+                job.error = None
+                await session.commit()
+            except Exception as error:
+                await session.rollback()
+                print(f"Job {job_id} ({kind}) failed on attempt {attempts}: {error!r}")
+                await self._record_failure(session, job_id, attempts, error)
+                return
+        if after_commit is not None:
+            try:
+                await after_commit(job)
+            except Exception as error:
+                # The job's work is committed, only the follow-up failed
+                print(f"Job {job_id} ({kind}) after-commit hook failed: {error!r}")
+
+    async def _record_failure(self, session: AsyncSession, job_id: int, attempts: int, error: Exception) -> None:
+        now = utcnow()
+        values = {"error": str(error)[:255] or type(error).__name__, "updated_at": now}
+        if attempts >= self.max_attempts:
+            values.update(status=JobStatus.FAILED)
+        else:
+            # Back off, e.g. while the LLM is failing, instead of claiming the job again at once
+            delay = timedelta(seconds=self.retry_backoff_seconds * 2 ** (attempts - 1))
+            values.update(status=JobStatus.QUEUED, not_before=now + delay)
+        await session.execute(update(Job).where(Job.id == job_id).values(**values))
+        await session.commit()
+
+
+def get_job_queue(request: Request) -> JobQueue:
+    return request.app.state.job_queue
@@ -1,5 +1,7 @@
-from typing import Union, Annotated
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Union, Annotated
 from typing_extensions import Doc
+import asyncio
 
 from fastapi.param_functions import Form
 
@@ -9,7 +11,8 @@ from fastapi.security import OAuth2PasswordRequestForm
 from passlib.context import CryptContext
 from fastapi_login import LoginManager
 from decouple import config
-from passlib.hash import pbkdf2_sha256
+
+from app.core.config import settings
 
 
 class NotAuthenticatedException(Exception):
@@ -17,16 +20,32 @@ class NotAuthenticatedException(Exception):
 
 SECRET = config("SECRET_KEY") 
 manager = LoginManager(SECRET, token_url="/login", use_header=True, not_authenticated_exception=NotAuthenticatedException)
-pwd_context = CryptContext(schemes=["bcrypt"])
+# Hashes with any other number of rounds are re-hashed on the next login
+pwd_context = CryptContext(
+    schemes=["pbkdf2_sha256"],
+    pbkdf2_sha256__default_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__min_rounds=settings.PASSWORD_HASH_ROUNDS,
+    pbkdf2_sha256__max_rounds=settings.PASSWORD_HASH_ROUNDS,
+)
+
+# PBKDF2 runs in hashlib, which releases the GIL, so a small thread pool keeps
+# hashing off the event loop and bounds how many run at once
+password_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash")
+
 
+async def hash_password(raw_password: str) -> str:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, pwd_context.hash, raw_password)
 
-def generate_hashed_password(raw_password: str) -> str:
-    hashed_password = pbkdf2_sha256.hash(raw_password)
-    return hashed_password
 
+async def verify_and_update_password(raw_password: str, hashed_password: str) -> tuple[bool, Optional[str]]:
+    """Check a password off the event loop.
 
-def verify_hashed_password(raw_password: str, hashed_password: str) -> bool:
-    return pbkdf2_sha256.verify(secret=raw_password, hash=hashed_password)
+    Also returns a new hash when the stored one uses an outdated work
+    factor, None otherwise.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(password_executor, pwd_context.verify_and_update, raw_password, hashed_password)
 
 
 class OAuth2PasswordNewRequestForm(OAuth2PasswordRequestForm):
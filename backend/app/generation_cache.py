@@ -0,0 +1,152 @@
+"""Cross-user cache of LLM-generated association options.
+
+Entries are keyed by normalized word, number of options and prompt version.
+A key is served from the cache once it has GENERATION_CACHE_VARIANTS
+variants (0 disables the cache), handing out the least used one. Warm it
+offline with ``python -m app.generation_cache [WORDS_FILE]``.
+"""
+from datetime import timedelta
+from typing import Iterable, Union
+import argparse
+import asyncio
+
+from pydantic import ValidationError
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models
+from app.models import normalize_word
+from app import schemas
+from app.core.config import settings
+from app.core.database import async_session
+from app.prompts import get_association_generator, ASSOCIATIONS_PROMPT_VERSION
+
+
+async def find_cached_options(
+    session: AsyncSession, words: Iterable[str], number_of_options: int, mark_used: bool = True
+) -> dict[str, schemas.AssociationSchema]:
+    """Cached options for the words that have enough variants, keyed by normalized word"""
+    variants = settings.GENERATION_CACHE_VARIANTS
+    normalized = {normalize_word(word) for word in words}
+    if variants <= 0 or not normalized:
+        return {}
+
+    query = select(models.GeneratedOptions).where(
+        models.GeneratedOptions.word.in_(normalized),
+        models.GeneratedOptions.number_of_options == number_of_options,
+        models.GeneratedOptions.prompt_version == ASSOCIATIONS_PROMPT_VERSION,
+    )
+    if settings.GENERATION_CACHE_MAX_AGE_DAYS > 0:
+        cutoff = models.utcnow() - timedelta(days=settings.GENERATION_CACHE_MAX_AGE_DAYS)
+        query = query.where(models.GeneratedOptions.created_at >= cutoff)
+
+    entries_by_word: dict[str, list[models.GeneratedOptions]] = {}
+    for entry in (await session.scalars(query)).all():
+        entries_by_word.setdefault(entry.word, []).append(entry)
+
+    cached = {}
+    for word, entries in entries_by_word.items():
+        if len(entries) < variants:
+            # Keep generating until the key has all its variants
+            continue
+        entry = min(entries, key=lambda entry: (entry.times_used, entry.id))
+        try:
+            cached[word] = schemas.AssociationSchema(vocabulary=word, options=entry.options)
+        except ValidationError:
+            # Stored before options were validated, generate the word again
+            continue
+        if mark_used:
+            entry.times_used += 1
+    return cached
+
+
+def store_generated_options(session: AsyncSession, word: str, number_of_options: int, generated: schemas.AssociationSchema) -> None:
+    if settings.GENERATION_CACHE_VARIANTS <= 0:
+        return
+    session.add(models.GeneratedOptions(
+        word=normalize_word(word),
+        number_of_options=number_of_options,
+        prompt_version=ASSOCIATIONS_PROMPT_VERSION,
+        options=generated.options,
+    ))
+
+
+async def generate_options_many(
+    session: AsyncSession, words: Iterable[str], number_of_options: int, concurrency: int, mark_used: bool = True
+) -> dict[str, Union[schemas.AssociationSchema, Exception]]:
+    """Options for many words, generating only the ones the cache cannot serve.
+
+    LLM calls run at most ``concurrency`` at a time and carry up to
+    GENERATION_BATCH_SIZE words each; every normalized word is generated
+    once. Results (or the exception raised by the generation) are keyed by
+    normalized word. New generations are added to the session and written
+    with the caller's transaction.
+    """
+    words_by_key = {}
+    for word in words:
+        words_by_key.setdefault(normalize_word(word), word)
+
+    results: dict[str, Union[schemas.AssociationSchema, Exception]] = dict(
+        await find_cached_options(session, words_by_key, number_of_options, mark_used=mark_used)
+    )
+    missing = [key for key in words_by_key if key not in results]
+    generator = get_association_generator()
+    if len(missing) > 1 and settings.GENERATION_BATCH_SIZE > 1:
+        # Several words per prompt instead of repeating the instructions for each
+        outcomes = await generator.generate_batched(
+            [words_by_key[key] for key in missing], number_of_options,
+            batch_size=settings.GENERATION_BATCH_SIZE, max_concurrency=concurrency,
+            max_retries=settings.GENERATION_BATCH_RETRIES,
+        )
+    else:
+        outcomes = await generator.generate_many(
+            [words_by_key[key] for key in missing], number_of_options, max_concurrency=concurrency
+        )
+    for key, outcome in zip(missing, outcomes):
+        if not isinstance(outcome, Exception):
+            try:
+                outcome = schemas.AssociationSchema.model_validate(outcome)
+            except ValidationError as error:
+                outcome = error
+            else:
+                store_generated_options(session, key, number_of_options, outcome)
+        results[key] = outcome
+    return results
+
+
+async def generate_options(session: AsyncSession, word: str, number_of_options: int) -> schemas.AssociationSchema:
+    """Options for one word, from the cache when possible. Raises if generation fails."""
+    results = await generate_options_many(session, [word], number_of_options, concurrency=1)
+    result = results[normalize_word(word)]
+    if isinstance(result, Exception):
+        raise result
+    return result
+
+
+async def warm(words: Iterable[str], number_of_options: int = 3) -> None:
+    async with async_session() as session:
+        if not words:
+            words = (await session.scalars(select(models.Vocabulary.word))).all()
+        results = await generate_options_many(
+            session, words, number_of_options,
+            concurrency=settings.ASSOCIATION_GENERATION_CONCURRENCY, mark_used=False,
+        )
+        await session.commit()
+
+    failed = [word for word, result in results.items() if isinstance(result, Exception)]
+    print(f"Generation cache warmed for {len(results) - len(failed)} words, {len(failed)} failed.")
+    for word in failed:
+        print(f"  {word}: {results[word]!r}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pre-generate association options into the shared generation cache.")
+    parser.add_argument("words_file", nargs="?", help="File with one word per line, defaults to every vocabulary")
+    parser.add_argument("--number-of-options", type=int, default=3)
+    args = parser.parse_args()
+
+    words = []
+    if args.words_file:
+        with open(args.words_file) as words_file:
+            words = [line.strip() for line in words_file if line.strip()]
+    asyncio.run(warm(words, number_of_options=args.number_of_options))
@@ -1,53 +1,142 @@
 from typing import Annotated, Optional
 from datetime import timedelta
-import json
+from contextlib import asynccontextmanager
+import hashlib
 
-from fastapi import FastAPI, Depends, status, HTTPException
+from fastapi import FastAPI, Depends, status, HTTPException, Response, Query, Request
 from fastapi.security import OAuth2PasswordBearer
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-
-from momento import CacheClient, Configurations, CredentialProvider
-from momento.responses import CacheGet, CreateCache
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import select, insert, update, bindparam, literal, Boolean
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
 
 from . import models
+from .models import normalize_word
 from . import schemas
-from app.core.database import create_db_and_tables, get_session
-from app.core.security import generate_hashed_password, verify_hashed_password, manager, OAuth2PasswordNewRequestForm
-from app.prompts import generate_associations
+from app.core.database import create_db_and_tables, get_session, async_session
+from app.core.jobs import JobQueue, get_job_queue
+from app.core.auth import AuthUser, user_cache
+from app.core.cache import CacheBackend, create_cache_backend, get_cache, get_namespace_version, invalidate_namespace
+from app.core.security import hash_password, verify_and_update_password, manager, OAuth2PasswordNewRequestForm
+from app.generation_cache import generate_options, generate_options_many
+from app.prompts import get_association_generator
+from app.streaming import iter_json_rows
+from app.stats import add_association_stats, add_answer_stats, record_answer, record_answers
+from app.search import search_vocabularies
 from app.core.config import settings
 
 
-SessionDep = Annotated[Session, Depends(get_session)]
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
 
-MOMENTO_API_KEY = settings.MOMENTO_API_KEY
+CacheDep = Annotated[CacheBackend, Depends(get_cache)]
+
+JobQueueDep = Annotated[JobQueue, Depends(get_job_queue)]
+
+CREATE_ASSOCIATION_JOB = "create_association"
+
+# Cache namespace of the global vocabulary list, its version backs the ETags
+VOCABULARIES_NAMESPACE = "vocabularies"
+
+# Load everything AssociationRead serializes in a fixed number of queries
+ASSOCIATION_READ_OPTIONS = (
+    joinedload(models.Association.user),
+    joinedload(models.Association.vocabulary),
+    selectinload(models.Association.options),
+)
+
+# RETURNING cannot carry joined eager loads, these run as follow-up SELECTs
+ANSWER_RETURNING_OPTIONS = (
+    selectinload(models.Association.user),
+    selectinload(models.Association.vocabulary),
+    selectinload(models.Association.options),
+)
+
+# One executemany for a batch of answers, one parameter set per answer in order
+ANSWER_BATCH_UPDATE = update(models.Association.__table__).where(
+    models.Association.id == bindparam("b_id")
+).values(
+    revision=bindparam("b_revision"),
+    **models.Association.answer_values(
+        bindparam("b_correct", type_=Boolean), bindparam("b_answered_at", type_=models.EpochDateTime)
+    )
+)
+
+# Keyset pagination: pages are addressed by the last id seen, never by OFFSET
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+LimitQuery = Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)]
+
+
+def json_response(adapter: TypeAdapter, content, status_code: int = status.HTTP_200_OK) -> Response:
+    """Serialize with a precompiled adapter; the shape is the same as the response_model's"""
+    return Response(content=schemas.dump_json(adapter, content), status_code=status_code, media_type="application/json")
 
-# Momento Cache setup
-def create_momento_client():
-    momento_api_key = CredentialProvider.from_string(MOMENTO_API_KEY)
-    ttl = timedelta(seconds=int(settings.MOMENTO_TTL_SECONDS))
-    config = {
-        'configuration': Configurations.Laptop.v1(),
-        'credential_provider': momento_api_key,
-        'default_ttl': ttl
-    }
-    return CacheClient.create(**config)
 
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names ``etag``"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    tags = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag in tags or "*" in tags
 
-# Create a cache dependency MomentoClientDep
-def get_momento_client():
-    client = create_momento_client()
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag, "Cache-Control": "private, no-cache"})
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+def paginate(rows, limit):
+    """Split a ``limit + 1`` row fetch into the page and the next cursor"""
+    if len(rows) > limit:
+        return rows[:limit], rows[limit - 1].id
+    return rows, None
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await create_db_and_tables()
+
+    # One cache (and Momento client) per worker process, shared by every request
+    cache = await create_cache_backend()
+    app.state.cache = cache
+
+    # Build the LLM chain (and its HTTP client) once instead of per generation
+    get_association_generator()
+
+    # Association generation runs in background workers, see POST /associations/
+    job_queue = JobQueue(
+        async_session,
+        workers=settings.JOB_WORKERS,
+        poll_interval_seconds=settings.JOB_POLL_INTERVAL_SECONDS,
+        lease_seconds=settings.JOB_LEASE_SECONDS,
+        max_attempts=settings.JOB_MAX_ATTEMPTS,
+        retry_backoff_seconds=settings.JOB_RETRY_BACKOFF_SECONDS,
+    )
+    job_queue.register(
+        CREATE_ASSOCIATION_JOB,
+        run_create_association_job,
+        after_commit=lambda job: invalidate_namespace(cache, f"user_associations_{job.user_id}"),
+    )
+    job_queue.start()
+    app.state.job_queue = job_queue
     try:
-        yield client
+        yield
     finally:
-        client.close()
+        await job_queue.stop()
+        await cache.close()
 
-MomentoClientDep = Annotated[CacheClient, Depends(get_momento_client)]
 
-# Cache name constant
-ASSOCIATIONS_CACHE_NAME = "user_associations"
-
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
 
 origins = [
     "http://localhost:5173",
@@ -59,6 +148,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "Location"],
 )
 
 
@@ -66,26 +156,16 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
 @manager.user_loader()
-async def get_user(email: str = None):
-    session = next(get_session())
-    return session.query(models.User).filter(models.User.email == email).first()
-
-
-@app.on_event("startup")
-def on_startup():
-    create_db_and_tables()
-    
-    # Create Momento cache at startup
-    client = create_momento_client()
-    resp = client.create_cache(ASSOCIATIONS_CACHE_NAME)
-    match resp:
-        case CreateCache.Success():
-            print(f"Momento cache '{ASSOCIATIONS_CACHE_NAME}' created or already exists.")
-        case CreateCache.Error() as error:
-            print(f"Error creating Momento cache: {error.message}")
-        case _:
-            print("Unreachable error state")
-    # client.close()
+async def get_user(email: str = None) -> Optional[AuthUser]:
+    """Resolve the token's user, from the in-process user cache when possible"""
+    user = user_cache.get(email)
+    if user is not None:
+        return user
+    async with async_session() as session:
+        db_user = await session.scalar(select(models.User).where(models.User.email == email))
+    if not db_user:
+        return None
+    return user_cache.set(db_user)
 
 
 @app.post("/login/", status_code=status.HTTP_200_OK)
@@ -93,14 +173,19 @@ async def login(session: SessionDep, data: OAuth2PasswordNewRequestForm = Depend
     email = data.email
     password = data.password
 
-    user = session.query(models.User).filter(models.User.email == email).first()
+    user = await session.scalar(select(models.User).where(models.User.email == email))
     if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Email not correct",
                             headers={"WWW-Authenticate": "Bearer"})
 
-    if not verify_hashed_password(raw_password=password, hashed_password=user.password):
+    verified, new_hash = await verify_and_update_password(raw_password=password, hashed_password=user.password)
+    if not verified:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Password not correct",
                             headers={"WWW-Authenticate": "Bearer"})
+    if new_hash:
+        # Stored with an outdated work factor
+        user.password = new_hash
+        await session.commit()
 
     access_token = manager.create_access_token(data={"sub": email}, expires=timedelta(hours=12))
     return {"access_token": access_token, "token_type": "bearer", "email": email}
@@ -108,317 +193,718 @@ async def login(session: SessionDep, data: OAuth2PasswordNewRequestForm = Depend
     
 @app.post("/users/", status_code=status.HTTP_201_CREATED, response_model=schemas.UserRead)
 async def create_user(user: schemas.UserCreate, session: SessionDep) -> schemas.UserRead:
-    existing_user = session.query(models.User).filter(models.User.email == user.email).first()
+    existing_user = await session.scalar(select(models.User).where(models.User.email == user.email))
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
-    db_user = models.User(first_name=user.first_name, last_name=user.last_name, email=user.email, password=user.password)
-    db_user.set_password(user.password)
+    hashed_password = await hash_password(user.password)
+    db_user = models.User(first_name=user.first_name, last_name=user.last_name, email=user.email, password=hashed_password)
     session.add(db_user)
-    session.commit()
-    session.refresh(db_user)
-    return db_user  
-
-
-@app.get("/users/", response_model=list[schemas.UserRead])
-async def get_users(session: SessionDep, ) -> list[schemas.UserRead]:
-    users = session.query(models.User).all()
-    return users
+    await session.flush()
+    session.add(models.UserStats(user_id=db_user.id))
+    await session.commit()
+    await session.refresh(db_user)
+    return json_response(schemas.user_read_adapter, db_user, status_code=status.HTTP_201_CREATED)
+
+
+@app.get("/users/", response_model=schemas.UserPage)
+async def get_users(session: SessionDep, cursor: Optional[int] = None, limit: LimitQuery = DEFAULT_PAGE_SIZE) -> schemas.UserPage:
+    query = select(models.User).order_by(models.User.id).limit(limit + 1)
+    if cursor is not None:
+        query = query.where(models.User.id > cursor)
+    users, next_cursor = paginate((await session.scalars(query)).all(), limit)
+    return json_response(schemas.user_page_adapter, {"items": users, "next_cursor": next_cursor})
     
     
 @app.get("/users/{user_id}/", response_model=schemas.UserRead)
 async def get_users(user_id: int, session: SessionDep) -> schemas.UserRead:
-    user = session.get(models.User, user_id)
+    user = await session.get(models.User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    return json_response(schemas.user_read_adapter, user)
+
+
+# INSERT constructs supporting ON CONFLICT, by dialect name
+ON_CONFLICT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+def on_conflict_insert(session: AsyncSession, entity):
+    """The INSERT of the session's database dialect, with ``on_conflict_do_nothing``"""
+    dialect = session.bind.dialect.name
+    if dialect not in ON_CONFLICT_INSERTS:
+        raise NotImplementedError(f"ON CONFLICT inserts are not supported on {dialect}")
+    return ON_CONFLICT_INSERTS[dialect](entity)
 
 
 @app.post("/vocabularies/", status_code=status.HTTP_201_CREATED, response_model=schemas.VocabularyRead)
-async def create_vocabulary(vocab: schemas.VocabularyCreate, session: SessionDep, current_user: models.User = Depends(manager)) -> schemas.VocabularyRead:
+async def create_vocabulary(vocab: schemas.VocabularyCreate, session: SessionDep, cache: CacheDep, current_user: AuthUser = Depends(manager)) -> schemas.VocabularyRead:
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     if not current_user.is_active:
         raise HTTPException(status_code=403, detail="Inactive user")
 
-    db_vocab = models.Vocabulary(word=vocab.word, meaning=vocab.meaning)
-    session.add(db_vocab)
-    session.commit()
-    session.refresh(db_vocab)
-    return db_vocab
+    # Upsert on the normalized word: a word that already exists is returned
+    # unchanged with 200 instead of being inserted again
+    normalized = normalize_word(vocab.word)
+    vocab_id = await session.scalar(
+        on_conflict_insert(session, models.Vocabulary)
+        .values(word=vocab.word, meaning=vocab.meaning, normalized_word=normalized)
+        .on_conflict_do_nothing(index_elements=[models.Vocabulary.normalized_word])
+        .returning(models.Vocabulary.id)
+    )
+    if vocab_id is None:
+        existing = await session.scalar(select(models.Vocabulary).where(models.Vocabulary.normalized_word == normalized))
+        return json_response(schemas.vocabulary_read_adapter, existing)
+
+    session.add(models.VocabularyStats(vocabulary_id=vocab_id))
+    await session.commit()
+    db_vocab = await session.get(models.Vocabulary, vocab_id)
+    await invalidate_namespace(cache, VOCABULARIES_NAMESPACE)
+    return json_response(schemas.vocabulary_read_adapter, db_vocab, status_code=status.HTTP_201_CREATED)
+
+
+def validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc']) or 'row'}: {err['msg']}" for err in error.errors()
+    )
+
+
+async def insert_vocabulary_chunk(session: AsyncSession, chunk: list[tuple[int, schemas.VocabularyCreate]]) -> list[schemas.BulkRowResult]:
+    """Insert one chunk with a single executemany in its own transaction.
+
+    Each normalized word is inserted once; rows repeating a word of the
+    chunk or of the database resolve to that vocabulary and are reported
+    as existing.
+    """
+    keys = []
+    first_by_key: dict[str, schemas.VocabularyCreate] = {}
+    for _, vocab in chunk:
+        key = normalize_word(vocab.word)
+        keys.append(key)
+        first_by_key.setdefault(key, vocab)
+    try:
+        result = await session.execute(
+            on_conflict_insert(session, models.Vocabulary)
+            .on_conflict_do_nothing(index_elements=[models.Vocabulary.normalized_word])
+            .returning(models.Vocabulary.normalized_word, models.Vocabulary.id),
+            [{**vocab.model_dump(), "normalized_word": key} for key, vocab in first_by_key.items()],
+        )
+        created_ids = dict(result.all())
+        ids_by_key = dict(created_ids)
+        existing_keys = first_by_key.keys() - created_ids.keys()
+        if existing_keys:
+            ids_by_key.update((await session.execute(
+                select(models.Vocabulary.normalized_word, models.Vocabulary.id)
+                .where(models.Vocabulary.normalized_word.in_(existing_keys))
+            )).all())
+        if created_ids:
+            await session.execute(insert(models.VocabularyStats), [{"vocabulary_id": vocab_id} for vocab_id in created_ids.values()])
+        await session.commit()
+    except SQLAlchemyError as error:
+        await session.rollback()
+        print(f"Bulk vocabulary insert failed: {error}")
+        return [schemas.BulkRowResult(index=index, error="Database error") for index, _ in chunk]
+
+    results = []
+    for (index, _), key in zip(chunk, keys):
+        # Only the first row of a word created here counts as created
+        results.append(schemas.BulkRowResult(index=index, id=ids_by_key[key], existing=key not in created_ids))
+        created_ids.pop(key, None)
+    return results
+
+
+@app.post("/vocabularies/bulk", response_model=schemas.BulkResult)
+async def create_vocabularies_bulk(request: Request, session: SessionDep, cache: CacheDep, current_user: AuthUser = Depends(manager)) -> schemas.BulkResult:
+    """Create vocabularies from a streamed NDJSON body or JSON array.
+
+    Rows are validated as they are read and inserted in chunks of
+    BULK_INSERT_CHUNK_SIZE, one transaction per chunk, so only the current
+    chunk of the payload is ever held in memory. Words that already exist
+    (after normalization) are not inserted again. Results are reported per
+    row, in input order.
+    """
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if not current_user.is_active:
+        raise HTTPException(status_code=403, detail="Inactive user")
 
+    try:
+        rows = iter_json_rows(request.stream(), request.headers.get("content-type", ""))
+    except ValueError as error:
+        raise HTTPException(status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE, detail=str(error))
+
+    results = []
+    chunk = []
+    index = 0
+    stream_error = None
+    try:
+        async for row in rows:
+            try:
+                if isinstance(row, bytes):
+                    vocab = schemas.VocabularyCreate.model_validate_json(row)
+                else:
+                    vocab = schemas.VocabularyCreate.model_validate(row)
+            except ValidationError as error:
+                results.append(schemas.BulkRowResult(index=index, error=validation_message(error)))
+            else:
+                chunk.append((index, vocab))
+            index += 1
+            if len(chunk) >= settings.BULK_INSERT_CHUNK_SIZE:
+                results.extend(await insert_vocabulary_chunk(session, chunk))
+                chunk = []
+    except ValueError as error:
+        # The body itself is malformed: keep the rows read so far and stop there
+        stream_error = str(error)
+    if chunk:
+        results.extend(await insert_vocabulary_chunk(session, chunk))
+
+    results.sort(key=lambda result: result.index)
+    failed = sum(1 for result in results if result.error)
+    existing = sum(1 for result in results if result.existing)
+    created = len(results) - failed - existing
+    if created:
+        await invalidate_namespace(cache, VOCABULARIES_NAMESPACE)
+    return {"created": created, "existing": existing, "failed": failed, "results": results, "error": stream_error}
+
+
+@app.get("/users/{user_id}/stats", response_model=schemas.UserStatsRead)
+async def get_user_stats(user_id: int, session: SessionDep, current_user: AuthUser = Depends(manager)) -> schemas.UserStatsRead:
+    """Learning statistics, read from the materialized totals"""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if not current_user.is_active:
+        raise HTTPException(status_code=403, detail="Inactive user")
+    if current_user.id != user_id and not current_user.is_superuser:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
 
-@app.get("/vocabularies/", response_model=list[schemas.VocabularyRead])
-async def get_vocabularies(session: SessionDep, current_user: models.User = Depends(manager)) -> list[schemas.VocabularyRead]:
+    stats = await session.get(models.UserStats, user_id)
+    if not stats:
+        raise HTTPException(status_code=404, detail="User not found")
+    return json_response(schemas.user_stats_adapter, stats)
+
+
+@app.get("/vocabularies/", response_model=schemas.VocabularyPage)
+async def get_vocabularies(
+    request: Request,
+    session: SessionDep,
+    cache: CacheDep,
+    cursor: Optional[int] = None,
+    limit: LimitQuery = DEFAULT_PAGE_SIZE,
+    current_user: AuthUser = Depends(manager)
+) -> schemas.VocabularyPage:
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     if not current_user.is_active:
         raise HTTPException(status_code=403, detail="Inactive user")
-    vocabularies = session.query(models.Vocabulary).all()
-    return vocabularies
+
+    etag = f'"{await get_namespace_version(cache, VOCABULARIES_NAMESPACE)}-{cursor}-{limit}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    query = select(models.Vocabulary).order_by(models.Vocabulary.id).limit(limit + 1)
+    if cursor is not None:
+        query = query.where(models.Vocabulary.id > cursor)
+    vocabularies, next_cursor = paginate((await session.scalars(query)).all(), limit)
+    return with_etag(json_response(schemas.vocabulary_page_adapter, {"items": vocabularies, "next_cursor": next_cursor}), etag)
+
+
+@app.get("/vocabularies/search", response_model=schemas.VocabularySearchPage)
+async def search_vocabularies_endpoint(
+    request: Request,
+    session: SessionDep,
+    cache: CacheDep,
+    q: Annotated[str, Query(min_length=1, max_length=100)],
+    cursor: Optional[str] = None,
+    limit: LimitQuery = DEFAULT_PAGE_SIZE,
+    current_user: AuthUser = Depends(manager)
+) -> schemas.VocabularySearchPage:
+    """Ranked prefix search over vocabulary words and meanings, see app.search"""
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if not current_user.is_active:
+        raise HTTPException(status_code=403, detail="Inactive user")
+
+    search_key = hashlib.blake2b(f"{q}\0{cursor}\0{limit}".encode(), digest_size=8).hexdigest()
+    etag = f'"{await get_namespace_version(cache, VOCABULARIES_NAMESPACE)}-search-{search_key}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    try:
+        vocabularies, next_cursor = await search_vocabularies(session, q, limit, cursor)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="Invalid cursor")
+    return with_etag(json_response(schemas.vocabulary_search_page_adapter, {"items": vocabularies, "next_cursor": next_cursor}), etag)
 
 
 @app.get("/vocabularies/{vocab_id}/", response_model=schemas.VocabularyRead)
-async def get_vocabulary_by_id(vocab_id: int, session: SessionDep, current_user: models.User = Depends(manager)) -> schemas.VocabularyRead:
+async def get_vocabulary_by_id(vocab_id: int, request: Request, session: SessionDep, cache: CacheDep, current_user: AuthUser = Depends(manager)) -> schemas.VocabularyRead:
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     if not current_user.is_active:
         raise HTTPException(status_code=403, detail="Inactive user")
-        
-    vocab = session.get(models.Vocabulary, vocab_id)
+
+    etag = f'"{await get_namespace_version(cache, VOCABULARIES_NAMESPACE)}-{vocab_id}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    vocab = await session.get(models.Vocabulary, vocab_id)
     if not vocab:
         raise HTTPException(status_code=404, detail="Vocabulary not found")
-    return vocab
+    return with_etag(json_response(schemas.vocabulary_read_adapter, vocab), etag)
 
 
-@app.post("/associations/", status_code=status.HTTP_201_CREATED, response_model=schemas.AssociationRead)
+@app.post("/associations/", status_code=status.HTTP_202_ACCEPTED, response_model=schemas.JobRead)
 async def create_association(
     association: schemas.AssociationCreate, 
     session: SessionDep, 
-    momento_client: MomentoClientDep,
-    current_user: models.User = Depends(manager)
-) -> schemas.AssociationRead:
+    job_queue: JobQueueDep,
+    response: Response,
+    current_user: AuthUser = Depends(manager)
+) -> schemas.JobRead:
+    """Queue generation of an association; poll the returned job for the result"""
     if not current_user:
         raise HTTPException(status_code=401, detail="Not authenticated")
     if not current_user.is_active:
         raise HTTPException(status_code=403, detail="Inactive user")
 
-    vocab = session.get(models.Vocabulary, association.vocabulary_id)
+    vocab = await session.get(models.Vocabulary, association.vocabulary_id)
     if not vocab:
         raise HTTPException(status_code=404, detail="Vocabulary not found")
 
-    generated_associations = await generate_associations(vocabulary=vocab.word, number_of_options=3)
-    generated_associations = generated_associations[0]
-    print(generated_associations)
+    job = await job_queue.enqueue(
+        session, CREATE_ASSOCIATION_JOB, {"vocabulary_id": vocab.id}, user_id=current_user.id
+    )
+    response.headers["Location"] = f"/jobs/{job.id}"
+    return job
 
-    db_association = models.Association(user_id=current_user.id, vocabulary_id=vocab.id)
-    session.add(db_association)
-    session.commit()
-    session.refresh(db_association)
-    
-    for option, meaning in generated_associations['options'].items():
-        if option.isupper():
-            is_correct = True
+
+async def run_create_association_job(session: AsyncSession, job: models.Job) -> dict:
+    vocab = await session.get(models.Vocabulary, job.payload["vocabulary_id"])
+    if not vocab:
+        raise ValueError("Vocabulary not found")
+
+    generated = await generate_options(session, vocab.word, number_of_options=3)
+
+    [association_id] = await insert_associations(session, job.user_id, [(vocab.id, generated)])
+    db_association = await session.scalar(
+        select(models.Association).options(*ASSOCIATION_READ_OPTIONS).where(models.Association.id == association_id)
+    )
+    # The job result carries the full association, loaded in the job's own transaction
+    return {
+        "association_id": association_id,
+        "association": schemas.association_read_adapter.dump_python(db_association, mode="json"),
+    }
+
+
+@app.get("/jobs/{job_id}", response_model=schemas.JobRead)
+async def get_job(job_id: int, session: SessionDep, current_user: AuthUser = Depends(manager)) -> schemas.JobRead:
+    job = await session.get(models.Job, job_id)
+    if not job or job.user_id != current_user.id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+async def reserve_association_revisions(session: AsyncSession, user_id: int, count: int = 1) -> int:
+    """Reserve ``count`` consecutive revisions for the user's associations.
+
+    Returns the first one. The counter row stays locked until the caller's
+    transaction ends, so revisions become visible in increasing order and
+    the delta sync never skips a change.
+    """
+    last = await session.scalar(
+        update(models.User).where(models.User.id == user_id).values(
+            association_revision=models.User.association_revision + count
+        ).returning(models.User.association_revision).execution_options(synchronize_session=False)
+    )
+    return last - count + 1
+
+
+async def insert_associations(
+    session: AsyncSession, user_id: int, generated: list[tuple[int, schemas.AssociationSchema]]
+) -> list[int]:
+    """Insert associations and all their options with one executemany each.
+
+    Upper-case options are the correct ones. Nothing is committed, so the
+    rows are written with the caller's transaction or not at all. Returns
+    the new association ids in input order.
+    """
+    if not generated:
+        return []
+    first_revision = await reserve_association_revisions(session, user_id, len(generated))
+    result = await session.execute(
+        insert(models.Association).returning(models.Association.id, sort_by_parameter_order=True),
+        [
+            {"user_id": user_id, "vocabulary_id": vocabulary_id, "revision": first_revision + i}
+            for i, (vocabulary_id, _) in enumerate(generated)
+        ],
+    )
+    association_ids = result.scalars().all()
+    options = [
+        {"association_id": association_id, "option": option, "meaning": meaning, "is_correct": option.isupper()}
+        for association_id, (_, generated_options) in zip(association_ids, generated)
+        for option, meaning in generated_options.options.items()
+    ]
+    if options:
+        await session.execute(insert(models.Option), options)
+    await add_association_stats(session, user_id, [vocabulary_id for vocabulary_id, _ in generated])
+    return association_ids
+
+
+@app.post("/associations/batch", status_code=status.HTTP_201_CREATED, response_model=schemas.AssociationBatchResult)
+async def create_associations_batch(
+    batch: schemas.AssociationBatchCreate,
+    session: SessionDep,
+    cache: CacheDep,
+    current_user: AuthUser = Depends(manager)
+) -> schemas.AssociationBatchResult:
+    """Generate associations for many vocabularies at once.
+
+    Options come from the shared generation cache where possible, the
+    remaining LLM calls run at most ASSOCIATION_GENERATION_CONCURRENCY at a
+    time. Every successful association is written in one transaction and
+    failures are reported per vocabulary.
+    """
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if not current_user.is_active:
+        raise HTTPException(status_code=403, detail="Inactive user")
+
+    vocabulary_ids = list(dict.fromkeys(batch.vocabulary_ids))
+    vocabs = (await session.scalars(
+        select(models.Vocabulary).where(models.Vocabulary.id.in_(vocabulary_ids))
+    )).all()
+
+    # Words already generated for anyone are served from the shared generation cache
+    generated_by_word = await generate_options_many(
+        session, [vocab.word for vocab in vocabs], number_of_options=3,
+        concurrency=settings.ASSOCIATION_GENERATION_CONCURRENCY,
+    )
+    generated_by_id = {vocab.id: generated_by_word[normalize_word(vocab.word)] for vocab in vocabs}
+
+    results = []
+    to_insert = []
+    for vocabulary_id in vocabulary_ids:
+        generated = generated_by_id.get(vocabulary_id)
+        if generated is None:
+            results.append(schemas.AssociationBatchItemResult(vocabulary_id=vocabulary_id, error="Vocabulary not found"))
+        elif isinstance(generated, Exception):
+            print(f"Association generation failed for vocabulary {vocabulary_id}: {generated!r}")
+            results.append(schemas.AssociationBatchItemResult(vocabulary_id=vocabulary_id, error="Generation failed"))
         else:
-            is_correct = False
-        db_option = models.Option(option=option, meaning=meaning, is_correct=is_correct, association_id=db_association.id)
-        session.add(db_option)
-        session.commit()
-        session.refresh(db_option)
-    
-    # Invalidate cache after adding new association
-    cache_key = f"user_associations_{current_user.id}"
-    momento_client.delete(ASSOCIATIONS_CACHE_NAME, cache_key)
+            to_insert.append((vocabulary_id, generated))
+            results.append(schemas.AssociationBatchItemResult(vocabulary_id=vocabulary_id))
 
-    return db_association
+    association_ids = await insert_associations(session, current_user.id, to_insert)
+    await session.commit()
+    if association_ids:
+        await invalidate_namespace(cache, f"user_associations_{current_user.id}")
 
+    associations_by_vocabulary = {vocabulary_id: association_id for (vocabulary_id, _), association_id in zip(to_insert, association_ids)}
+    for result in results:
+        result.association_id = associations_by_vocabulary.get(result.vocabulary_id)
+    failed = sum(1 for result in results if result.error)
+    return {"created": len(results) - failed, "failed": failed, "results": results}
 
-@app.get("/associations/", response_model=list[schemas.AssociationRead])
+
+@app.get("/associations/", response_model=schemas.AssociationPage)
 async def get_associations(
+    request: Request,
     session: SessionDep, 
-    momento_client: MomentoClientDep,
-    current_user: models.User = Depends(manager)
-) -> list[schemas.AssociationRead]:
-    """Get all associations for the current user, using Momento Cache for performance"""
+    cache: CacheDep,
+    cursor: Optional[int] = None,
+    limit: LimitQuery = DEFAULT_PAGE_SIZE,
+    current_user: AuthUser = Depends(manager)
+) -> schemas.AssociationPage:
+    """Get a page of pending associations for the current user, newest first, using the cache for performance"""
     
-    # Create a cache key based on the user ID
-    cache_key = f"user_associations_{current_user.id}"
+    # Create a cache key for this page, every page of the user shares one version
+    version = await get_namespace_version(cache, f"user_associations_{current_user.id}")
+    cache_key = f"user_associations_{current_user.id}_{version}_{cursor}_{limit}"
+
+    # The client already has this page: no cache lookup, query or serialization
+    etag = f'"{current_user.id}-{version}-{cursor}-{limit}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
     # Try to get from cache first
-    cache_resp = momento_client.get(ASSOCIATIONS_CACHE_NAME, cache_key)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        # Cache hit - the payload is the exact response body
+        print("Cache hit for user associations")
+        return with_etag(Response(content=cached, media_type="application/json"), etag)
+
+    # Cache miss - query the database
+    print("Cache miss for user associations - querying database")
+    query = select(models.Association).options(
+        *ASSOCIATION_READ_OPTIONS
+    ).order_by(
+        models.Association.id.desc()
+    ).where(
+        models.Association.user_id == current_user.id, 
+        models.Association.status == "pending"
+    ).limit(limit + 1)
+    if cursor is not None:
+        query = query.where(models.Association.id < cursor)
+    associations, next_cursor = paginate((await session.scalars(query)).unique().all(), limit)
+    
+    # Serialize once and store the response bytes with default TTL
+    payload = schemas.dump_json(schemas.association_page_adapter, {"items": associations, "next_cursor": next_cursor})
+    await cache.set(cache_key, payload)
     
-    match cache_resp:
-        case CacheGet.Hit():
-            # Cache hit - return the cached data
-            print("Cache hit for user associations")
-            cached_data = json.loads(cache_resp.value_string)
-            return [schemas.AssociationRead.parse_obj(assoc) for assoc in cached_data]
-        
-        case CacheGet.Miss():
-            # Cache miss - query the database
-            print("Cache miss for user associations - querying database")
-            associations = session.query(models.Association).order_by(
-                models.Association.id.desc()
-            ).filter(
-                models.Association.user_id == current_user.id, 
-                models.Association.status == "pending"
-            ).all()
-            
-            # Store in cache for future requests
-            # Convert associations to a JSON-serializable list
-            associations_data = [assoc.__dict__ for assoc in associations]
-            
-            # Remove SQLAlchemy state attributes
-            for assoc in associations_data:
-                if '_sa_instance_state' in assoc:
-                    del assoc['_sa_instance_state']
-            
-            # Store in cache with default TTL
-            momento_client.set(ASSOCIATIONS_CACHE_NAME, cache_key, json.dumps(associations_data))
-            
-            return associations
-        
-        case CacheGet.Error() as error:
-            # Handle cache error gracefully by falling back to database
-            print(f"Momento cache error: {error.message}. Falling back to database.")
-            associations = session.query(models.Association).order_by(
-                models.Association.id.desc()
-            ).filter(
-                models.Association.user_id == current_user.id, 
-                models.Association.status == "pending"
-            ).all()
-            return associations
-        
-        case _:
-            # Unreachable but handle gracefully
-            print("Unreachable cache state. Falling back to database.")
-            associations = session.query(models.Association).order_by(
-                models.Association.id.desc()
-            ).filter(
-                models.Association.user_id == current_user.id, 
-                models.Association.status == "pending"
-            ).all()
-            return associations
+    return with_etag(Response(content=payload, media_type="application/json"), etag)
+
+
+@app.get("/associations/changes", response_model=schemas.AssociationChanges)
+async def get_association_changes(
+    session: SessionDep,
+    since: Annotated[int, Query(ge=0)] = 0,
+    limit: LimitQuery = DEFAULT_PAGE_SIZE,
+    current_user: AuthUser = Depends(manager)
+) -> schemas.AssociationChanges:
+    """Associations changed since the ``since`` cursor, oldest change first.
+
+    Pending associations come back in full, the ones no longer pending only
+    by id. Pass the returned cursor as ``since`` on the next poll; while
+    ``has_more`` is set there are further changes to fetch right away.
+    """
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if not current_user.is_active:
+        raise HTTPException(status_code=403, detail="Inactive user")
+
+    changed = (await session.scalars(
+        select(models.Association).options(
+            *ASSOCIATION_READ_OPTIONS
+        ).where(
+            models.Association.user_id == current_user.id,
+            models.Association.revision > since
+        ).order_by(models.Association.revision).limit(limit + 1)
+    )).unique().all()
+    has_more = len(changed) > limit
+    changed = changed[:limit]
+
+    return json_response(schemas.association_changes_adapter, {
+        "items": [association for association in changed if association.status == models.AssociationStatus.PENDING],
+        "removed": [association.id for association in changed if association.status != models.AssociationStatus.PENDING],
+        "cursor": changed[-1].revision if changed else since,
+        "has_more": has_more,
+    })
 
 
 @app.get("/associations/{association_id}", response_model=schemas.AssociationRead)
 async def get_association(
     association_id: int, 
+    request: Request,
     session: SessionDep, 
-    momento_client: MomentoClientDep,
-    current_user: models.User = Depends(manager)
+    cache: CacheDep,
+    current_user: AuthUser = Depends(manager)
 ) -> schemas.AssociationRead:
     """Get a specific association by ID"""
-    # Create a cache key for this specific association
-    cache_key = f"association_{current_user.id}_{association_id}"
+    # Every write to the user's associations bumps the namespace version, which
+    # retires this key along with the listing pages
+    version = await get_namespace_version(cache, f"user_associations_{current_user.id}")
+    cache_key = f"association_{current_user.id}_{version}_{association_id}"
+    etag = f'"{current_user.id}-{version}-{association_id}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
     
     # Try to get from cache first
-    cache_resp = momento_client.get(ASSOCIATIONS_CACHE_NAME, cache_key)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        print(f"Cache hit for association {association_id}")
+        return with_etag(Response(content=cached, media_type="application/json"), etag)
+
+    # Cache miss - query the database
+    print(f"Cache miss for association {association_id} - querying database")
+    association = await session.scalar(
+        select(models.Association).options(
+            *ASSOCIATION_READ_OPTIONS
+        ).where(
+            models.Association.id == association_id,
+            models.Association.user_id == current_user.id
+        )
+    )
+    
+    if not association:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Association not found"
+        )
+    
+    # Serialize once and store the response bytes for future requests
+    payload = schemas.dump_json(schemas.association_read_adapter, association)
+    await cache.set(cache_key, payload)
     
-    match cache_resp:
-        case CacheGet.Hit():
-            # Cache hit
-            print(f"Cache hit for association {association_id}")
-            cached_data = json.loads(cache_resp.value_string)
-            return schemas.AssociationRead.parse_obj(cached_data)
-            
-        case CacheGet.Miss():
-            # Cache miss - query the database
-            print(f"Cache miss for association {association_id} - querying database")
-            association = session.query(models.Association).filter(
-                models.Association.id == association_id,
-                models.Association.user_id == current_user.id
-            ).first()
-            
-            if not association:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Association not found"
-                )
-            
-            # Store in cache for future requests
-            association_data = association.__dict__.copy()
-            if '_sa_instance_state' in association_data:
-                del association_data['_sa_instance_state']
-                
-            momento_client.set(ASSOCIATIONS_CACHE_NAME, cache_key, json.dumps(association_data))
-            
-            return association
-            
-        case CacheGet.Error() as error:
-            # Handle cache error by falling back to database
-            print(f"Cache error: {error.message}. Falling back to database.")
-            association = session.query(models.Association).filter(
-                models.Association.id == association_id,
-                models.Association.user_id == current_user.id
-            ).first()
-            
-            if not association:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Association not found"
-                )
-            
-            return association
-            
-        case _:
-            # Unreachable but handle gracefully
-            association = session.query(models.Association).filter(
-                models.Association.id == association_id,
-                models.Association.user_id == current_user.id
-            ).first()
-            
-            if not association:
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Association not found"
-                )
-            
-            return association
+    return with_etag(Response(content=payload, media_type="application/json"), etag)
+
+
+async def answer_association(session: AsyncSession, user_id: int, association_id: int, correct: bool) -> Optional[models.Association]:
+    """Record one answer with a single UPDATE ... RETURNING.
+
+    Counters and schedule are computed by the database and the response is
+    built from the returned row. Returns None when the user has no such
+    association.
+    """
+    revision = await reserve_association_revisions(session, user_id)
+    return await session.scalar(
+        update(models.Association).where(
+            models.Association.id == association_id,
+            models.Association.user_id == user_id
+        ).values(
+            revision=revision,
+            **models.Association.answer_values(
+                literal(correct, Boolean), literal(models.utcnow(), models.EpochDateTime)
+            )
+        ).returning(models.Association).options(*ANSWER_RETURNING_OPTIONS).execution_options(populate_existing=True)
+    )
 
 
 @app.put("/associations/{association_id}/correct", response_model=schemas.AssociationRead)
 async def update_association_correct(
     association_id: int, 
     session: SessionDep, 
-    momento_client: MomentoClientDep,
-    current_user: models.User = Depends(manager)
+    cache: CacheDep,
+    current_user: AuthUser = Depends(manager)
 ) -> schemas.AssociationRead:
     """Update a specific association by ID"""
-    association = session.query(models.Association).filter(
-        models.Association.id == association_id,
-        models.Association.user_id == current_user.id
-    ).first()
-    
+    association = await answer_association(session, current_user.id, association_id, correct=True)
     if not association:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Association not found"
         )
-    
-    association.correct_option()
-    session.add(association)
-    session.commit()
-    session.refresh(association)
+    await add_answer_stats(session, current_user.id, [record_answer(association, correct=True)])
+    await session.commit()
     
     # Invalidate caches after update
-    user_key = f"user_associations_{current_user.id}"
-    assoc_key = f"association_{current_user.id}_{association_id}"
+    await invalidate_namespace(cache, f"user_associations_{current_user.id}")
     
-    momento_client.delete(ASSOCIATIONS_CACHE_NAME, user_key)
-    momento_client.delete(ASSOCIATIONS_CACHE_NAME, assoc_key)
-    
-    return association
+    return json_response(schemas.association_read_adapter, association)
 
 
 @app.put("/associations/{association_id}/incorrect", response_model=schemas.AssociationRead)
 async def update_association_incorrect(
     association_id: int, 
     session: SessionDep, 
-    momento_client: MomentoClientDep,
-    current_user: models.User = Depends(manager)
+    cache: CacheDep,
+    current_user: AuthUser = Depends(manager)
 ) -> schemas.AssociationRead:
     """Update a specific association by ID"""
-    association = session.query(models.Association).filter(
-        models.Association.id == association_id,
-        models.Association.user_id == current_user.id
-    ).first()
-    
+    association = await answer_association(session, current_user.id, association_id, correct=False)
     if not association:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Association not found"
         )
-    
-    association.incorrect_option()
-    session.add(association)
-    session.commit()
-    session.refresh(association)
+    await add_answer_stats(session, current_user.id, [record_answer(association, correct=False)])
+    await session.commit()
     
     # Invalidate caches after update
-    user_key = f"user_associations_{current_user.id}"
-    assoc_key = f"association_{current_user.id}_{association_id}"
+    await invalidate_namespace(cache, f"user_associations_{current_user.id}")
     
-    momento_client.delete(ASSOCIATIONS_CACHE_NAME, user_key)
-    momento_client.delete(ASSOCIATIONS_CACHE_NAME, assoc_key)
-    
-    return association
\ No newline at end of file
+    return json_response(schemas.association_read_adapter, association)
+
+
+@app.post("/associations/answers", response_model=schemas.AnswerBatchResult)
+async def submit_answers(
+    batch: schemas.AnswerBatchCreate,
+    session: SessionDep,
+    cache: CacheDep,
+    current_user: AuthUser = Depends(manager)
+) -> schemas.AnswerBatchResult:
+    """Record many quiz answers, e.g. a session buffered offline, at once.
+
+    Answers are applied in order by one executemany UPDATE in one
+    transaction, followed by a single cache invalidation. Unknown
+    associations are reported per answer.
+    """
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if not current_user.is_active:
+        raise HTTPException(status_code=403, detail="Inactive user")
+
+    owned = set((await session.scalars(
+        select(models.Association.id).where(
+            models.Association.id.in_({answer.association_id for answer in batch.answers}),
+            models.Association.user_id == current_user.id
+        )
+    )).all())
+
+    applied = [answer for answer in batch.answers if answer.association_id in owned]
+    if applied:
+        first_revision = await reserve_association_revisions(session, current_user.id, len(applied))
+        # Read after the reservation, which holds the user's write lock until
+        # commit: no other answer can move these counters in between
+        before = {
+            row.id: (row.vocabulary_id, row.number_of_times_correct)
+            for row in await session.execute(
+                select(
+                    models.Association.id, models.Association.vocabulary_id, models.Association.number_of_times_correct
+                ).where(models.Association.id.in_({answer.association_id for answer in applied}))
+            )
+        }
+        answered_at = models.utcnow()
+        await session.execute(ANSWER_BATCH_UPDATE, [
+            {"b_id": answer.association_id, "b_revision": revision, "b_correct": answer.correct, "b_answered_at": answered_at}
+            for revision, answer in enumerate(applied, start=first_revision)
+        ])
+        await add_answer_stats(session, current_user.id, record_answers(
+            before, [(answer.association_id, answer.correct) for answer in applied]
+        ))
+        await session.commit()
+        await invalidate_namespace(cache, f"user_associations_{current_user.id}")
+
+    results = []
+    for answer in batch.answers:
+        if answer.association_id in owned:
+            answer_status = models.AssociationStatus.CORRECT if answer.correct else models.AssociationStatus.INCORRECT
+            results.append(schemas.AnswerResult(association_id=answer.association_id, status=answer_status))
+        else:
+            results.append(schemas.AnswerResult(association_id=answer.association_id, error="Association not found"))
+
+    failed = sum(1 for result in results if result.error)
+    return {"applied": len(results) - failed, "failed": failed, "results": results}
+
+
+@app.get("/reviews/due", response_model=schemas.ReviewQueue)
+async def get_due_reviews(
+    session: SessionDep,
+    limit: LimitQuery = DEFAULT_PAGE_SIZE,
+    current_user: AuthUser = Depends(manager)
+) -> schemas.ReviewQueue:
+    """The user's associations due for review, most overdue first.
+
+    Reads the (user_id, next_review_at) index, so the cost depends on
+    ``limit`` and not on the size of the user's history. When fewer than
+    ``limit`` items are due, ``next_review_at`` tells when the next one is.
+    """
+    if not current_user:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    if not current_user.is_active:
+        raise HTTPException(status_code=403, detail="Inactive user")
+
+    now = models.utcnow()
+    due = (await session.scalars(
+        select(models.Association).options(
+            *ASSOCIATION_READ_OPTIONS
+        ).where(
+            models.Association.user_id == current_user.id,
+            models.Association.next_review_at <= now
+        ).order_by(models.Association.next_review_at).limit(limit)
+    )).unique().all()
+
+    next_review_at = None
+    if len(due) < limit:
+        next_review_at = await session.scalar(
+            select(models.Association.next_review_at).where(
+                models.Association.user_id == current_user.id,
+                models.Association.next_review_at > now
+            ).order_by(models.Association.next_review_at).limit(1)
+        )
+    return json_response(schemas.review_queue_adapter, {"items": due, "next_review_at": next_review_at})
+
+
+@app.get("/cache/stats/")
+async def get_cache_stats(cache: CacheDep, current_user: AuthUser = Depends(manager)) -> dict:
+    """Hit, miss and eviction counters of this worker's cache tiers"""
+    if not current_user.is_superuser:
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+    stats = cache.get_stats()
+    stats.update(users=user_cache.get_stats())
+    return stats
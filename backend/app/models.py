@@ -1,19 +1,43 @@
-from typing import List
+from typing import List, Optional
+from datetime import datetime, timedelta, timezone
 import enum
 
-from sqlalchemy import Integer, String, Boolean
+from sqlalchemy import Integer, String, Boolean, Index, DateTime, JSON, Float, DDL, TypeDecorator, case, event, literal
 from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.orm import mapped_column, Mapped, Relationship
 from sqlalchemy import Enum 
 from sqlalchemy import ForeignKey
 
-from app.core.security import generate_hashed_password
-
 
 class Base(DeclarativeBase):
     pass
 
 
+def utcnow() -> datetime:
+    # Stored naive, SQLite has no time zone support
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class EpochDateTime(TypeDecorator):
+    """A naive UTC datetime stored as seconds since the epoch.
+
+    Date arithmetic becomes plain numbers, so the database can compute a
+    time inside an UPDATE, the same way on SQLite and PostgreSQL.
+    """
+    impl = Float
+    cache_ok = True
+
+    def process_bind_param(self, value: Optional[datetime], dialect) -> Optional[float]:
+        if value is None:
+            return None
+        return value.replace(tzinfo=timezone.utc).timestamp()
+
+    def process_result_value(self, value: Optional[float], dialect) -> Optional[datetime]:
+        if value is None:
+            return None
+        return datetime.fromtimestamp(value, timezone.utc).replace(tzinfo=None)
+
+
 class User(Base):
     __tablename__ = "user"
 
@@ -24,23 +48,67 @@ class User(Base):
     password: Mapped[str] = mapped_column(String(100))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False)
+    # Last revision handed out to this user's associations, see Association.revision
+    association_revision: Mapped[int] = mapped_column(Integer, default=0)
 
     associations: Mapped[List["Association"]] = Relationship(back_populates="user", cascade="all, delete-orphan")
-   
-    def set_password(self, raw_password):
-        self.password = generate_hashed_password(raw_password=raw_password)
+
+
+def normalize_word(word: str) -> str:
+    """The form words are deduplicated and looked up by"""
+    return word.strip().casefold()
 
 
 class Vocabulary(Base):
     __tablename__ = "vocabulary"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    word: Mapped[str] = mapped_column(String(50))
+    word: Mapped[str] = mapped_column(String(50), index=True)
     meaning: Mapped[str] = mapped_column(String(50))
+    # normalize_word(word): one vocabulary per normalized word
+    normalized_word: Mapped[str] = mapped_column(String(50), unique=True, index=True)
 
     associations: Mapped[List["Association"]] = Relationship(back_populates="vocabulary", cascade="all, delete-orphan")
 
 
+# Full-text index of vocabulary words and meanings, see app.search. It is an
+# external-content FTS5 table holding only the index; the triggers keep it in
+# step with every write to ``vocabulary``, bulk inserts and raw SQL included.
+VOCABULARY_FTS_TABLE = "vocabulary_fts"
+VOCABULARY_FTS_DDL = (
+    f"CREATE VIRTUAL TABLE {VOCABULARY_FTS_TABLE} USING fts5("
+    "word, meaning, content='vocabulary', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    f"CREATE TRIGGER {VOCABULARY_FTS_TABLE}_ai AFTER INSERT ON vocabulary BEGIN "
+    f"INSERT INTO {VOCABULARY_FTS_TABLE}(rowid, word, meaning) VALUES (new.id, new.word, new.meaning); END",
+    f"CREATE TRIGGER {VOCABULARY_FTS_TABLE}_ad AFTER DELETE ON vocabulary BEGIN "
+    f"INSERT INTO {VOCABULARY_FTS_TABLE}({VOCABULARY_FTS_TABLE}, rowid, word, meaning) VALUES ('delete', old.id, old.word, old.meaning); END",
+    f"CREATE TRIGGER {VOCABULARY_FTS_TABLE}_au AFTER UPDATE OF word, meaning ON vocabulary BEGIN "
+    f"INSERT INTO {VOCABULARY_FTS_TABLE}({VOCABULARY_FTS_TABLE}, rowid, word, meaning) VALUES ('delete', old.id, old.word, old.meaning); "
+    f"INSERT INTO {VOCABULARY_FTS_TABLE}(rowid, word, meaning) VALUES (new.id, new.word, new.meaning); END",
+)
+
+for statement in VOCABULARY_FTS_DDL:
+    event.listen(Vocabulary.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+event.listen(Vocabulary.__table__, "before_drop", DDL(f"DROP TABLE IF EXISTS {VOCABULARY_FTS_TABLE}").execute_if(dialect="sqlite"))
+
+
+# Spaced repetition, a binary-grade SM-2: correct answers grow the interval
+# (1 day, 6 days, then times the ease), a miss resets it and lowers the ease
+INITIAL_EASE = 2.5
+MIN_EASE = 1.3
+EASE_STEP_CORRECT = 0.1
+EASE_STEP_INCORRECT = 0.2
+# Missed items come back within the same session
+RELEARN_DELAY = timedelta(minutes=10)
+SECONDS_PER_DAY = 86400
+# Streaks of correct answers grow the interval geometrically, cap it so the
+# due date stays a representable datetime
+MAX_INTERVAL_DAYS = 36500.0
+# An association counts as mastered once answered correctly this many times
+MASTERED_AFTER_CORRECT = 3
+
+
 class AssociationStatus(enum.Enum):
     PENDING = "pending"
     CORRECT = "correct"
@@ -49,12 +117,25 @@ class AssociationStatus(enum.Enum):
 
 class Association(Base):
     __tablename__ = "association"
+    __table_args__ = (
+        # Serves the per-user "pending, newest first" listing
+        Index("ix_association_user_id_status_id", "user_id", "status", "id"),
+        # Serves the delta sync, "changed since revision N"
+        Index("ix_association_user_id_revision", "user_id", "revision"),
+        # Serves the review queue, "due first"
+        Index("ix_association_user_id_next_review_at", "user_id", "next_review_at"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     status: Mapped[AssociationStatus] = mapped_column(Enum(AssociationStatus, name="association_status", native_enum=True, values_callable=lambda x: [i.value for i in x]), default=AssociationStatus.PENDING.value)
     number_of_times_played: Mapped[int] = mapped_column(Integer, default=0)
     number_of_times_correct: Mapped[int] = mapped_column(Integer, default=0)
     number_of_times_incorrect: Mapped[int] = mapped_column(Integer, default=0)
+    # Bumped from the user's counter on every write, increasing per user
+    revision: Mapped[int] = mapped_column(Integer, default=0)
+    next_review_at: Mapped[datetime] = mapped_column(EpochDateTime, default=utcnow)
+    interval_days: Mapped[float] = mapped_column(Float, default=0.0)
+    ease: Mapped[float] = mapped_column(Float, default=INITIAL_EASE)
 
     user_id: Mapped[int] = mapped_column(Integer, ForeignKey("user.id"))
     user: Mapped["User"] = Relationship(back_populates="associations")
@@ -64,15 +145,41 @@ class Association(Base):
 
     options: Mapped[List["Option"]] = Relationship(back_populates="association", cascade="all, delete-orphan")
 
-    def correct_option(self):
-        self.status = AssociationStatus.CORRECT
-        self.number_of_times_played += 1
-        self.number_of_times_correct += 1
+    @classmethod
+    def answer_values(cls, correct, answered_at) -> dict:
+        """SET clause recording one answer, evaluated by the database.
 
-    def incorrect_option(self):
-        self.status = AssociationStatus.INCORRECT
-        self.number_of_times_played += 1
-        self.number_of_times_incorrect += 1
+        ``correct`` is a boolean SQL expression and ``answered_at`` an
+        EpochDateTime one, literals or executemany parameters. Concurrent
+        answers, e.g. from several devices, all count instead of
+        overwriting each other as a read-modify-write in Python would. The
+        interval, ease and next review time are computed in the same
+        statement; every expression sees the row as it was before it.
+        """
+        grown_interval = case(
+            (cls.interval_days < 1, 1.0),
+            (cls.interval_days < 6, 6.0),
+            (cls.interval_days * cls.ease > MAX_INTERVAL_DAYS, MAX_INTERVAL_DAYS),
+            else_=cls.interval_days * cls.ease,
+        )
+        return {
+            "status": case(
+                (correct, literal(AssociationStatus.CORRECT, cls.status.type)),
+                else_=literal(AssociationStatus.INCORRECT, cls.status.type),
+            ),
+            "number_of_times_played": cls.number_of_times_played + 1,
+            "number_of_times_correct": cls.number_of_times_correct + case((correct, 1), else_=0),
+            "number_of_times_incorrect": cls.number_of_times_incorrect + case((correct, 0), else_=1),
+            "interval_days": case((correct, grown_interval), else_=0.0),
+            "ease": case(
+                (correct, cls.ease + EASE_STEP_CORRECT),
+                (cls.ease - EASE_STEP_INCORRECT < MIN_EASE, MIN_EASE),
+                else_=cls.ease - EASE_STEP_INCORRECT,
+            ),
+            "next_review_at": answered_at + case(
+                (correct, grown_interval * SECONDS_PER_DAY), else_=RELEARN_DELAY.total_seconds()
+            ),
+        }
 
 
 class Option(Base):
@@ -83,5 +190,74 @@ class Option(Base):
     meaning: Mapped[str] = mapped_column(String(255))
     is_correct: Mapped[bool] = mapped_column(Boolean, default=False)
 
-    association_id: Mapped[int] = mapped_column(Integer, ForeignKey("association.id"))
-    association: Mapped["Association"] = Relationship(back_populates="options")
\ No newline at end of file
+    association_id: Mapped[int] = mapped_column(Integer, ForeignKey("association.id"), index=True)
+    association: Mapped["Association"] = Relationship(back_populates="options")
+
+
+class JobStatus(enum.Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class Job(Base):
+    __tablename__ = "job"
+    __table_args__ = (
+        # Serves the worker's "oldest claimable job" lookup
+        Index("ix_job_status_id", "status", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    kind: Mapped[str] = mapped_column(String(50))
+    status: Mapped[JobStatus] = mapped_column(Enum(JobStatus, name="job_status", native_enum=True, values_callable=lambda x: [i.value for i in x]), default=JobStatus.QUEUED.value)
+    payload: Mapped[dict] = mapped_column(JSON)
+    result: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, default=0)
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # A failed attempt is not retried before this time
+    not_before: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow, onupdate=utcnow)
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("user.id"))
+
+
+class GeneratedOptions(Base):
+    __tablename__ = "generated_options"
+    __table_args__ = (
+        Index("ix_generated_options_key", "word", "number_of_options", "prompt_version"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    word: Mapped[str] = mapped_column(String(50))
+    number_of_options: Mapped[int] = mapped_column(Integer)
+    prompt_version: Mapped[int] = mapped_column(Integer)
+    options: Mapped[dict] = mapped_column(JSON)
+    times_used: Mapped[int] = mapped_column(Integer, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow)
+
+
+class UserStats(Base):
+    """Running totals of a user's associations and answers, see app.stats"""
+    __tablename__ = "user_stats"
+
+    user_id: Mapped[int] = mapped_column(Integer, ForeignKey("user.id"), primary_key=True)
+    associations: Mapped[int] = mapped_column(Integer, default=0)
+    played: Mapped[int] = mapped_column(Integer, default=0)
+    correct: Mapped[int] = mapped_column(Integer, default=0)
+    incorrect: Mapped[int] = mapped_column(Integer, default=0)
+    mastered: Mapped[int] = mapped_column(Integer, default=0)
+
+
+class VocabularyStats(Base):
+    """Running totals of a vocabulary's associations and answers, see app.stats"""
+    __tablename__ = "vocabulary_stats"
+
+    vocabulary_id: Mapped[int] = mapped_column(Integer, ForeignKey("vocabulary.id"), primary_key=True)
+    associations: Mapped[int] = mapped_column(Integer, default=0)
+    played: Mapped[int] = mapped_column(Integer, default=0)
+    correct: Mapped[int] = mapped_column(Integer, default=0)
+    incorrect: Mapped[int] = mapped_column(Integer, default=0)
+    mastered: Mapped[int] = mapped_column(Integer, default=0)
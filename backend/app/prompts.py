@@ -1,17 +1,23 @@
+from functools import lru_cache
+from typing import Optional, Union
 import asyncio
 
+from pydantic import ValidationError
+
+from langchain_core.language_models import BaseChatModel
 from langchain_core.prompts import PromptTemplate
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.output_parsers.json import JsonOutputParser
 
-from .schemas import AssociationSchema 
+from .models import normalize_word
+from .schemas import AssociationSchema, AssociationBatchSchema
 from app.core.config import settings
 
 
-async def generate_associations(vocabulary, number_of_options):
-    generated_associations_output_parser = JsonOutputParser(pydantic_object=AssociationSchema)
-    generated_associations_format_instructions = generated_associations_output_parser.get_format_instructions()
-    generate_associations_template = """
+# Bump whenever the template changes so cached generations are not reused
+ASSOCIATIONS_PROMPT_VERSION = 1
+
+GENERATE_ASSOCIATIONS_TEMPLATE = """
 
         This is an association game. Generate a dictionary where each key is an option word and its value is the meaning of that word.
         The game is for the user to associate similar words with the given vocabulary. The main vocabulary must have correct associations.
@@ -32,24 +38,119 @@ async def generate_associations(vocabulary, number_of_options):
 
         Format instructions: {format_instructions}
         """
-    generate_associations_prompt = PromptTemplate(
-        template=generate_associations_template,
-        input_variables=["vocabulary", "number_of_options"],
-        partial_variables={"format_instructions": generated_associations_format_instructions})
-
-    llm = ChatGoogleGenerativeAI(google_api_key=settings.GEMINI_API_KEY, temperature=0.5, model='gemini-2.5-flash-preview-04-17')
-
-    generated_associations = generate_associations_prompt | llm | generated_associations_output_parser
-
-    tasks = [
-        generated_associations.ainvoke({"vocabulary": vocabulary,
-                                     "number_of_options": number_of_options,
-                                     })
-    ]
-    list_of_tasks = await asyncio.gather(*tasks)
-
-    # result = generated_questions.invoke({"number_of_questions": number_of_questions,
-    #                                      "number_of_options": number_of_options,
-    #                                      'text': text})
-    
-    return list_of_tasks
\ No newline at end of file
+
+GENERATE_ASSOCIATIONS_BATCH_TEMPLATE = """
+
+        This is an association game. For each vocabulary below, generate a dictionary where each key is an option word and its value is the meaning of that word.
+        The game is for the user to associate similar words with the given vocabulary. Each vocabulary must have correct associations.
+        Generate {number_of_options} options for each vocabulary.
+        
+        For the correct option:
+        - The key (word) should be in UPPERCASE
+        - The value should be its meaning/definition
+        - It should be a synonym of the vocabulary
+        
+        For the incorrect options:
+        - The keys (words) should be in lowercase
+        - The values should be their meanings/definitions
+        - They should NOT be synonyms of the vocabulary
+        
+        Return one entry per vocabulary and repeat the vocabulary exactly as given.
+                    
+        The vocabularies are, one per line:
+        {vocabularies}
+        The number_of_options is: {number_of_options}  
+
+        Format instructions: {format_instructions}
+        """
+
+
+class AssociationGenerator:
+    """Prompt, LLM and parser chained once and reused for every generation.
+
+    The LLM client, and with it its HTTP connections, is shared by every
+    call instead of being rebuilt per word.
+    """
+
+    def __init__(self, llm: Optional[BaseChatModel] = None):
+        self.output_parser = JsonOutputParser(pydantic_object=AssociationSchema)
+        self.prompt = PromptTemplate(
+            template=GENERATE_ASSOCIATIONS_TEMPLATE,
+            input_variables=["vocabulary", "number_of_options"],
+            partial_variables={"format_instructions": self.output_parser.get_format_instructions()})
+        self.llm = llm or ChatGoogleGenerativeAI(google_api_key=settings.GEMINI_API_KEY, temperature=0.5, model='gemini-2.5-flash-preview-04-17')
+        self.chain = self.prompt | self.llm | self.output_parser
+
+        self.batch_output_parser = JsonOutputParser(pydantic_object=AssociationBatchSchema)
+        self.batch_prompt = PromptTemplate(
+            template=GENERATE_ASSOCIATIONS_BATCH_TEMPLATE,
+            input_variables=["vocabularies", "number_of_options"],
+            partial_variables={"format_instructions": self.batch_output_parser.get_format_instructions()})
+        self.batch_chain = self.batch_prompt | self.llm | self.batch_output_parser
+
+    async def generate(self, vocabulary: str, number_of_options: int) -> dict:
+        return await self.chain.ainvoke({"vocabulary": vocabulary, "number_of_options": number_of_options})
+
+    async def generate_many(self, vocabularies: list[str], number_of_options: int, max_concurrency: int) -> list[Union[dict, Exception]]:
+        """One result per vocabulary, in order; a failed generation is returned as its exception"""
+        if not vocabularies:
+            return []
+        return await self.chain.abatch(
+            [{"vocabulary": vocabulary, "number_of_options": number_of_options} for vocabulary in vocabularies],
+            config={"max_concurrency": max_concurrency},
+            return_exceptions=True,
+        )
+
+    async def _generate_group(self, vocabularies: list[str], number_of_options: int) -> dict[str, Union[dict, Exception]]:
+        """One prompt for the whole group, each returned item validated on its own"""
+        try:
+            output = await self.batch_chain.ainvoke({
+                "vocabularies": "\n".join(vocabularies),
+                "number_of_options": number_of_options,
+            })
+            items = output["associations"]
+        except Exception as error:
+            return {vocabulary: error for vocabulary in vocabularies}
+
+        requested = {normalize_word(vocabulary): vocabulary for vocabulary in vocabularies}
+        results: dict[str, Union[dict, Exception]] = {}
+        for item in items if isinstance(items, list) else []:
+            try:
+                association = AssociationSchema.model_validate(item)
+            except ValidationError:
+                continue
+            vocabulary = requested.get(normalize_word(association.vocabulary))
+            if vocabulary is not None:
+                results[vocabulary] = item
+        for vocabulary in vocabularies:
+            results.setdefault(vocabulary, ValueError(f"No valid options generated for '{vocabulary}'"))
+        return results
+
+    async def generate_batched(self, vocabularies: list[str], number_of_options: int, batch_size: int,
+                               max_concurrency: int, max_retries: int) -> list[Union[dict, Exception]]:
+        """Like generate_many, but sends up to ``batch_size`` words per prompt.
+
+        Words whose item is missing or invalid are retried, in new groups,
+        up to ``max_retries`` times; the words that succeeded are kept.
+        """
+        results: dict[str, Union[dict, Exception]] = {}
+        pending = list(dict.fromkeys(vocabularies))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def run(group: list[str]) -> dict[str, Union[dict, Exception]]:
+            async with semaphore:
+                return await self._generate_group(group, number_of_options)
+
+        for _ in range(max_retries + 1):
+            if not pending:
+                break
+            groups = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+            for group_results in await asyncio.gather(*(run(group) for group in groups)):
+                results.update(group_results)
+            pending = [vocabulary for vocabulary in pending if isinstance(results[vocabulary], Exception)]
+        return [results[vocabulary] for vocabulary in vocabularies]
+
+
+@lru_cache(maxsize=None)
+def get_association_generator() -> AssociationGenerator:
+    return AssociationGenerator()
@@ -1,6 +1,7 @@
-from typing import Dict, List
-from pydantic import BaseModel, Field
-from app.models import AssociationStatus
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+from pydantic import BaseModel, Field, TypeAdapter, computed_field, field_validator
+from app.models import AssociationStatus, JobStatus, normalize_word
 
 
 class UserBase(BaseModel):
@@ -20,10 +21,40 @@ class UserRead(UserBase):
         from_attributes = True
 
 
+class UserPage(BaseModel):
+    items: List[UserRead]
+    next_cursor: Optional[int] = None
+
+
+class UserStatsRead(BaseModel):
+    user_id: int
+    associations: int
+    played: int
+    correct: int
+    incorrect: int
+    mastered: int
+
+    @computed_field
+    @property
+    def accuracy(self) -> float:
+        return self.correct / self.played if self.played else 0.0
+
+    class Config:
+        from_attributes = True
+
+
 class VocabularyCreate(BaseModel):
-    word: str
+    word: str = Field(min_length=1)
     meaning: str
 
+    @field_validator("word")
+    @classmethod
+    def word_not_blank(cls, word: str) -> str:
+        # Vocabularies are unique per normalized word, a blank one would absorb every other
+        if not normalize_word(word):
+            raise ValueError("must not be blank")
+        return word
+
 class VocabularyRead(BaseModel):
     id: int
     word: str
@@ -33,6 +64,33 @@ class VocabularyRead(BaseModel):
         from_attributes = True
 
 
+class VocabularyPage(BaseModel):
+    items: List[VocabularyRead]
+    next_cursor: Optional[int] = None
+
+
+class VocabularySearchPage(BaseModel):
+    items: List[VocabularyRead]
+    # Opaque, pass it back as ``cursor`` for the next page
+    next_cursor: Optional[str] = None
+
+
+class BulkRowResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    # The word was already there, ``id`` is the vocabulary it resolved to
+    existing: bool = False
+    error: Optional[str] = None
+
+
+class BulkResult(BaseModel):
+    created: int
+    existing: int = 0
+    failed: int
+    results: List[BulkRowResult]
+    error: Optional[str] = None
+
+
 class OptionBase(BaseModel):
     id: int
     option: str
@@ -45,6 +103,57 @@ class AssociationCreate(BaseModel):
     vocabulary_id: int
 
 
+class JobRead(BaseModel):
+    id: int
+    kind: str
+    status: JobStatus
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    attempts: int
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class AssociationBatchCreate(BaseModel):
+    vocabulary_ids: List[int] = Field(min_length=1, max_length=500)
+
+
+class AssociationBatchItemResult(BaseModel):
+    vocabulary_id: int
+    association_id: Optional[int] = None
+    error: Optional[str] = None
+
+
+class AssociationBatchResult(BaseModel):
+    created: int
+    failed: int
+    results: List[AssociationBatchItemResult]
+
+
+class AnswerCreate(BaseModel):
+    association_id: int
+    correct: bool
+
+
+class AnswerBatchCreate(BaseModel):
+    answers: List[AnswerCreate] = Field(min_length=1, max_length=500)
+
+
+class AnswerResult(BaseModel):
+    association_id: int
+    status: Optional[AssociationStatus] = None
+    error: Optional[str] = None
+
+
+class AnswerBatchResult(BaseModel):
+    applied: int
+    failed: int
+    results: List[AnswerResult]
+
+
 class AssociationRead(BaseModel):
     id: int
     status: AssociationStatus
@@ -59,7 +168,55 @@ class AssociationRead(BaseModel):
         from_attributes = True
 
 
+class AssociationPage(BaseModel):
+    items: List[AssociationRead]
+    next_cursor: Optional[int] = None
+
+
+class ReviewQueue(BaseModel):
+    items: List[AssociationRead]
+    next_review_at: Optional[datetime] = None
+
+
+class AssociationChanges(BaseModel):
+    items: List[AssociationRead]
+    removed: List[int]
+    cursor: int
+    has_more: bool
+
+
+# Precompiled serializers: responses are encoded straight to JSON bytes by
+# pydantic-core instead of going through FastAPI's response_model round trip
+user_read_adapter = TypeAdapter(UserRead)
+user_page_adapter = TypeAdapter(UserPage)
+user_stats_adapter = TypeAdapter(UserStatsRead)
+vocabulary_read_adapter = TypeAdapter(VocabularyRead)
+vocabulary_page_adapter = TypeAdapter(VocabularyPage)
+vocabulary_search_page_adapter = TypeAdapter(VocabularySearchPage)
+association_read_adapter = TypeAdapter(AssociationRead)
+association_page_adapter = TypeAdapter(AssociationPage)
+association_changes_adapter = TypeAdapter(AssociationChanges)
+review_queue_adapter = TypeAdapter(ReviewQueue)
+
+
+def dump_json(adapter: TypeAdapter, content: Any) -> bytes:
+    """Validate ORM objects (or dicts of them) and encode them in one pass"""
+    return adapter.dump_json(adapter.validate_python(content, from_attributes=True))
+
+
 class AssociationSchema(BaseModel):
     vocabulary: str
     options: Dict[str, str] = Field(description="This is a dictionary of options. The key is the option and the value is the meaning.")
 
+    @field_validator("options")
+    @classmethod
+    def has_correct_option(cls, options: Dict[str, str]) -> Dict[str, str]:
+        # Upper-case options are the correct ones, see insert_associations
+        if not any(option.isupper() for option in options):
+            raise ValueError("needs at least one upper-case (correct) option")
+        return options
+
+
+class AssociationBatchSchema(BaseModel):
+    associations: List[AssociationSchema] = Field(description="One entry per vocabulary, in the order the vocabularies were given.")
+
@@ -0,0 +1,76 @@
+"""Vocabulary search over the ``vocabulary_fts`` full-text index.
+
+Every word of the query is matched as a prefix of a word or meaning token,
+case and diacritics insensitively, and all of them must match. Results are
+ranked by bm25 with matches in the word weighing more than matches in the
+meaning, and paginated by keyset on (rank, id).
+"""
+from typing import Optional
+import re
+
+from sqlalchemy import select, func, literal_column, table, column, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models
+
+
+# bm25 weights of the indexed columns, in declaration order (word, meaning)
+WORD_WEIGHT = 10.0
+MEANING_WEIGHT = 1.0
+# Longer queries are cut down to their first terms
+MAX_QUERY_TERMS = 8
+
+_TERM = re.compile(r"\w+")
+
+vocabulary_fts = table(models.VOCABULARY_FTS_TABLE, column("rowid"))
+
+
+def match_expression(text: str) -> Optional[str]:
+    """FTS5 query for free text, or None when it has nothing to search for.
+
+    Terms are quoted so user input can never be read as FTS5 syntax.
+    """
+    terms = _TERM.findall(text)[:MAX_QUERY_TERMS]
+    if not terms:
+        return None
+    return " ".join(f'"{term}"*' for term in terms)
+
+
+def encode_cursor(rank: float, vocabulary_id: int) -> str:
+    return f"{rank!r}:{vocabulary_id}"
+
+
+def decode_cursor(cursor: str) -> tuple[float, int]:
+    """Raises ``ValueError`` for a cursor this module did not hand out"""
+    rank, vocabulary_id = cursor.rsplit(":", 1)
+    return float(rank), int(vocabulary_id)
+
+
+async def search_vocabularies(
+    session: AsyncSession, text: str, limit: int, cursor: Optional[str] = None
+) -> tuple[list[models.Vocabulary], Optional[str]]:
+    """One page of matching vocabularies, best first, and the next page's cursor"""
+    expression = match_expression(text)
+    if expression is None:
+        return [], None
+
+    fts = literal_column(models.VOCABULARY_FTS_TABLE)
+    rank = func.bm25(fts, WORD_WEIGHT, MEANING_WEIGHT)
+    query = (
+        select(models.Vocabulary, rank)
+        .select_from(vocabulary_fts)
+        .join(models.Vocabulary, models.Vocabulary.id == vocabulary_fts.c.rowid)
+        .where(fts.op("MATCH")(expression))
+        .order_by(rank, models.Vocabulary.id)
+        .limit(limit + 1)
+    )
+    if cursor is not None:
+        query = query.where(tuple_(rank, models.Vocabulary.id) > tuple_(*decode_cursor(cursor)))
+
+    rows = (await session.execute(query)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last, last_rank = rows[-1]
+        next_cursor = encode_cursor(last_rank, last.id)
+    return [vocabulary for vocabulary, _ in rows], next_cursor
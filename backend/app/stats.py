@@ -0,0 +1,167 @@
+"""Materialized learning statistics.
+
+``user_stats`` and ``vocabulary_stats`` hold running totals kept up to date
+by the association create and answer paths, so reading them is a primary
+key lookup. Recompute them from the association table, or only check them,
+with ``python -m app.stats [--check]``.
+"""
+from collections import Counter
+from typing import Iterable, NamedTuple
+import argparse
+import asyncio
+import sys
+
+from sqlalchemy import select, update, delete, insert, bindparam, func, case
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import models
+from app.core.database import async_session
+
+
+STAT_COLUMNS = ("associations", "played", "correct", "incorrect", "mastered")
+
+
+class RecordedAnswer(NamedTuple):
+    vocabulary_id: int
+    correct: bool
+    mastered: bool
+
+
+def record_answer(association: models.Association, correct: bool) -> RecordedAnswer:
+    """Describe an answer from the association as it was right after the answer"""
+    mastered = correct and association.number_of_times_correct == models.MASTERED_AFTER_CORRECT
+    return RecordedAnswer(association.vocabulary_id, correct, mastered)
+
+
+def record_answers(before: dict[int, tuple[int, int]], answers: Iterable[tuple[int, bool]]) -> list[RecordedAnswer]:
+    """Describe answers applied in order by one executemany.
+
+    ``before`` maps each association id to its (vocabulary_id,
+    number_of_times_correct) as read before the answers, ``answers`` are
+    (association_id, correct) pairs.
+    """
+    correct_counts = {association_id: count for association_id, (_, count) in before.items()}
+    recorded = []
+    for association_id, correct in answers:
+        if correct:
+            correct_counts[association_id] += 1
+        mastered = correct and correct_counts[association_id] == models.MASTERED_AFTER_CORRECT
+        recorded.append(RecordedAnswer(before[association_id][0], correct, mastered))
+    return recorded
+
+
+def _increment_vocabulary_stats(*columns: str):
+    table = models.VocabularyStats.__table__
+    return update(table).where(table.c.vocabulary_id == bindparam("b_vocabulary_id")).values(
+        {column: table.c[column] + bindparam(f"b_{column}") for column in columns}
+    )
+
+
+async def add_association_stats(session: AsyncSession, user_id: int, vocabulary_ids: list[int]) -> None:
+    """Count new associations, in the caller's transaction"""
+    if not vocabulary_ids:
+        return
+    await session.execute(
+        update(models.UserStats).where(models.UserStats.user_id == user_id).values(
+            associations=models.UserStats.associations + len(vocabulary_ids)
+        )
+    )
+    await session.execute(_increment_vocabulary_stats("associations"), [
+        {"b_vocabulary_id": vocabulary_id, "b_associations": count}
+        for vocabulary_id, count in Counter(vocabulary_ids).items()
+    ])
+
+
+async def add_answer_stats(session: AsyncSession, user_id: int, answers: list[RecordedAnswer]) -> None:
+    """Count answers with one UPDATE per user and one executemany for the vocabularies"""
+    if not answers:
+        return
+    correct = sum(answer.correct for answer in answers)
+    await session.execute(
+        update(models.UserStats).where(models.UserStats.user_id == user_id).values(
+            played=models.UserStats.played + len(answers),
+            correct=models.UserStats.correct + correct,
+            incorrect=models.UserStats.incorrect + len(answers) - correct,
+            mastered=models.UserStats.mastered + sum(answer.mastered for answer in answers),
+        )
+    )
+    per_vocabulary: dict[int, dict] = {}
+    for answer in answers:
+        totals = per_vocabulary.setdefault(answer.vocabulary_id, {
+            "b_vocabulary_id": answer.vocabulary_id, "b_played": 0, "b_correct": 0, "b_incorrect": 0, "b_mastered": 0,
+        })
+        totals["b_played"] += 1
+        totals["b_correct" if answer.correct else "b_incorrect"] += 1
+        totals["b_mastered"] += answer.mastered
+    await session.execute(
+        _increment_vocabulary_stats("played", "correct", "incorrect", "mastered"),
+        list(per_vocabulary.values()),
+    )
+
+
+async def _expected(session: AsyncSession, key, ids: Iterable[int]) -> dict[int, tuple]:
+    """Totals recomputed from the association table, zero for ids without associations"""
+    association = models.Association
+    rows = await session.execute(
+        select(
+            key,
+            func.count(association.id),
+            func.sum(association.number_of_times_played),
+            func.sum(association.number_of_times_correct),
+            func.sum(association.number_of_times_incorrect),
+            func.sum(case((association.number_of_times_correct >= models.MASTERED_AFTER_CORRECT, 1), else_=0)),
+        ).group_by(key)
+    )
+    expected = {id: (0,) * len(STAT_COLUMNS) for id in ids}
+    for id, *totals in rows:
+        expected[id] = tuple(total or 0 for total in totals)
+    return expected
+
+
+async def _rebuild_table(session: AsyncSession, stats_model, key_column: str, expected: dict[int, tuple], check_only: bool) -> int:
+    actual = {
+        getattr(row, key_column): tuple(getattr(row, column) for column in STAT_COLUMNS)
+        for row in (await session.scalars(select(stats_model))).all()
+    }
+    mismatched = 0
+    for id in expected.keys() | actual.keys():
+        if expected.get(id) != actual.get(id):
+            mismatched += 1
+            print(f"  {stats_model.__tablename__} {id}: stored {actual.get(id)}, expected {expected.get(id)}")
+    if not check_only:
+        await session.execute(delete(stats_model))
+        if expected:
+            await session.execute(insert(stats_model), [
+                {key_column: id, **dict(zip(STAT_COLUMNS, totals))} for id, totals in expected.items()
+            ])
+    return mismatched
+
+
+async def rebuild(check_only: bool = False) -> int:
+    """Recompute both tables from scratch, returns the number of rows that were off"""
+    async with async_session() as session:
+        user_ids = (await session.scalars(select(models.User.id))).all()
+        vocabulary_ids = (await session.scalars(select(models.Vocabulary.id))).all()
+        mismatched = await _rebuild_table(
+            session, models.UserStats, "user_id",
+            await _expected(session, models.Association.user_id, user_ids), check_only,
+        )
+        mismatched += await _rebuild_table(
+            session, models.VocabularyStats, "vocabulary_id",
+            await _expected(session, models.Association.vocabulary_id, vocabulary_ids), check_only,
+        )
+        if not check_only:
+            await session.commit()
+
+    action = "Checked" if check_only else "Rebuilt"
+    print(f"{action} learning statistics: {mismatched} rows were inconsistent.")
+    return mismatched
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute the materialized learning statistics from the association table.")
+    parser.add_argument("--check", action="store_true", help="Only report inconsistent rows, change nothing")
+    args = parser.parse_args()
+
+    mismatched = asyncio.run(rebuild(check_only=args.check))
+    sys.exit(1 if args.check and mismatched else 0)
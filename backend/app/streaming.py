@@ -0,0 +1,118 @@
+from typing import AsyncIterator, Any, Union
+import codecs
+import json
+
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+# A single row larger than this is treated as malformed input
+MAX_ROW_BYTES = 1024 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\r\n"
+# What may follow an array element
+_DELIMITERS = ",]" + _WHITESPACE
+
+
+async def iter_ndjson(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    """Yield each non-blank line of an NDJSON body as raw bytes.
+
+    Lines are left unparsed so a malformed line only fails its own row.
+    """
+    pending = b""
+    async for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+        if len(pending) > MAX_ROW_BYTES:
+            raise ValueError("NDJSON row too large")
+    if pending.strip():
+        yield pending
+
+
+async def iter_json_array(chunks: AsyncIterator[bytes]) -> AsyncIterator[Any]:
+    """Yield the elements of a top-level JSON array as they arrive.
+
+    Only the element currently being received is buffered. Raises
+    ``ValueError`` when the body is not a well-formed array, including
+    anything but whitespace after its closing bracket.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    started = False
+    closed = False
+    # Last structural token seen: "[", "," or a value
+    last = None
+
+    async def _feed():
+        async for chunk in chunks:
+            yield text_decoder.decode(chunk)
+        yield text_decoder.decode(b"", final=True)
+
+    async for text in _feed():
+        if closed:
+            if text.strip(_WHITESPACE):
+                raise ValueError("Unexpected data after JSON array")
+            continue
+        buffer += text
+        pos = 0
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                break
+            if not started:
+                if buffer[pos] != "[":
+                    raise ValueError("Expected a JSON array")
+                started = True
+                last = "["
+                pos += 1
+                continue
+            if buffer[pos] == "]":
+                if last == ",":
+                    raise ValueError("Trailing comma in JSON array")
+                if buffer[pos + 1:].strip(_WHITESPACE):
+                    raise ValueError("Unexpected data after JSON array")
+                # Keep reading, so data arriving after the array is rejected too
+                closed = True
+                pos = len(buffer)
+                break
+            if last == "value":
+                if buffer[pos] != ",":
+                    raise ValueError("Expected ',' between JSON array elements")
+                last = ","
+                pos += 1
+                continue
+            try:
+                value, end = _decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Most likely the element is split across chunks
+                break
+            if not isinstance(value, (dict, list, str)) and (end == len(buffer) or buffer[end] not in _DELIMITERS):
+                # A bare number or literal is only complete once a delimiter
+                # follows: "1." may still become "1.5e10" with the next chunk
+                break
+            yield value
+            last = "value"
+            pos = end
+        buffer = buffer[pos:]
+        if len(buffer) > MAX_ROW_BYTES:
+            raise ValueError("JSON array element too large or malformed")
+
+    if closed:
+        return
+    if not started:
+        raise ValueError("Expected a JSON array")
+    raise ValueError("Malformed or unterminated JSON array")
+
+
+def iter_json_rows(chunks: AsyncIterator[bytes], content_type: str) -> AsyncIterator[Union[bytes, Any]]:
+    """Pick the row iterator for a request body from its content type"""
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type in NDJSON_MEDIA_TYPES:
+        return iter_ndjson(chunks)
+    if media_type == "application/json":
+        return iter_json_array(chunks)
+    raise ValueError(f"Unsupported content type '{media_type}'")
@@ -0,0 +1,71 @@
+"""Per-call overhead of the association chain, built once vs per call.
+
+Generates options for one word through ``AssociationGenerator`` with a
+stub LLM that answers instantly, so what is timed is the chain itself:
+
+- ``shared``: one generator, built up front and reused (what the app does)
+- ``rebuild``: parser, prompt and chain built again for every call
+- ``rebuild + client``: the same, plus a new Gemini client per call, as
+  before the chain was shared (the client is built but never called)
+
+    python -m benchmarks.generator [--calls N]
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+
+# The app reads its settings on import
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-long-enough-for-hs256")
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+from langchain_core.language_models import FakeListChatModel
+from langchain_google_genai import ChatGoogleGenerativeAI
+
+from app.core.config import settings
+from app.prompts import AssociationGenerator
+
+RESPONSE = json.dumps({"vocabulary": "happy", "options": {"GLAD": "pleased", "sad": "unhappy", "tired": "sleepy"}})
+
+
+def stub_llm() -> FakeListChatModel:
+    return FakeListChatModel(responses=[RESPONSE])
+
+
+async def measure(generate, calls: int) -> list[float]:
+    """Milliseconds per call"""
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        result = await generate()
+        timings.append((time.perf_counter() - start) * 1000)
+        assert result["options"]
+    return timings
+
+
+async def main(calls: int) -> None:
+    shared = AssociationGenerator(llm=stub_llm())
+
+    async def rebuild_with_client():
+        ChatGoogleGenerativeAI(google_api_key=settings.GEMINI_API_KEY, temperature=0.5, model="gemini-2.5-flash-preview-04-17")
+        return await AssociationGenerator(llm=stub_llm()).generate("happy", 3)
+
+    modes = (
+        ("shared", lambda: shared.generate("happy", 3)),
+        ("rebuild", lambda: AssociationGenerator(llm=stub_llm()).generate("happy", 3)),
+        ("rebuild + client", rebuild_with_client),
+    )
+    print(f"{calls} calls, stub LLM, ms per call")
+    for name, generate in modes:
+        await measure(generate, 3)  # warm up imports and caches
+        timings = await measure(generate, calls)
+        print(f"{name:<17} mean {statistics.mean(timings):7.2f} ms  p50 {statistics.median(timings):7.2f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.calls))
@@ -0,0 +1,86 @@
+"""Login throughput and the latency other requests see meanwhile.
+
+``--logins`` clients log in back to back while ``--clients`` clients read
+a user, for ``--duration`` seconds. Password hashing running on the event
+loop shows up as a high p99 for the reads. Start the server first, one
+worker and without access logs, e.g.
+
+    PASSWORD_HASH_ROUNDS=200000 uvicorn app.main:app --port 8000 --no-access-log > /dev/null &
+    python -m benchmarks.login --url http://127.0.0.1:8000 [--logins 40] [--clients 40]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+async def setup(client: httpx.AsyncClient) -> tuple[str, int]:
+    """Register a throwaway user, returns its email and id"""
+    email = f"login-{uuid.uuid4().hex}@example.com"
+    response = await client.post("/users/", json={"first_name": "Login", "last_name": "Test", "email": email, "password": "password"})
+    response.raise_for_status()
+    return email, response.json()["id"]
+
+
+async def run_login(client: httpx.AsyncClient, email: str, deadline: float, latencies: list[float], errors: list[str]) -> None:
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.post("/login/", data={"email": email, "password": "password"})
+            response.raise_for_status()
+        except httpx.HTTPError as error:
+            errors.append(repr(error))
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def run_reader(client: httpx.AsyncClient, user_id: int, deadline: float, latencies: list[float], errors: list[str]) -> None:
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.get(f"/users/{user_id}/")
+            response.raise_for_status()
+        except httpx.HTTPError as error:
+            errors.append(repr(error))
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+def report(name: str, latencies: list[float], elapsed: float) -> None:
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:<7} {len(latencies) / elapsed:8.1f} req/s  p50 {percentiles[49]:7.1f} ms  p99 {percentiles[98]:7.1f} ms")
+
+
+async def main(url: str, logins: int, clients: int, duration: float) -> None:
+    limits = httpx.Limits(max_connections=logins + clients, max_keepalive_connections=logins + clients)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        email, user_id = await setup(client)
+        login_latencies: list[float] = []
+        read_latencies: list[float] = []
+        errors: list[str] = []
+        start = time.perf_counter()
+        deadline = start + duration
+        await asyncio.gather(
+            *(run_login(client, email, deadline, login_latencies, errors) for _ in range(logins)),
+            *(run_reader(client, user_id, deadline, read_latencies, errors) for _ in range(clients)),
+        )
+        elapsed = time.perf_counter() - start
+
+    print(f"{logins} login clients, {clients} read clients, {elapsed:.1f} s, {len(errors)} errors")
+    report("logins", login_latencies, elapsed)
+    report("reads", read_latencies, elapsed)
+    if errors:
+        print(f"first error: {errors[0]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--logins", type=int, default=40, help="concurrent clients logging in")
+    parser.add_argument("--clients", type=int, default=40, help="concurrent clients reading a user")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.logins, args.clients, args.duration))
@@ -0,0 +1,128 @@
+"""Per-request latency with a Momento client per request vs one per process.
+
+Runs the association read endpoints through the ASGI app against an
+in-memory stand-in for Momento. The stand-in charges a connection cost
+when a client is created (gRPC channel and TLS handshake) and a round trip
+per call, both configurable. Both modes put MomentoCache behind the app
+without the L1 tier, so every lookup reaches the stand-in.
+
+    python -m benchmarks.momento_client [--requests N] [--connect-ms MS] [--rtt-ms MS]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+# The app reads its settings on import
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-long-enough-for-hs256")
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+os.environ.setdefault("CACHE_BACKEND", "memory")
+os.environ.setdefault("CHAPERONE_SQLITE_FILE_NAME", os.path.join(tempfile.mkdtemp(), "benchmark.db"))
+
+import httpx
+from momento.responses import CacheGet, CacheSet, CacheDelete
+
+from app import schemas
+from app.core.cache import MomentoCache, ASSOCIATIONS_CACHE_NAME, get_cache
+from app.core.database import async_session, engine
+from app.main import app, lifespan, insert_associations
+
+
+class InMemoryMomento:
+    """The calls of CacheClientAsync that MomentoCache makes, over a shared dict"""
+
+    def __init__(self, store: dict, rtt_seconds: float):
+        self.store = store
+        self.rtt_seconds = rtt_seconds
+
+    @classmethod
+    async def create(cls, store: dict, connect_seconds: float, rtt_seconds: float) -> "InMemoryMomento":
+        await asyncio.sleep(connect_seconds)
+        return cls(store, rtt_seconds)
+
+    async def get(self, cache_name: str, key: str):
+        await asyncio.sleep(self.rtt_seconds)
+        value = self.store.get(key)
+        return CacheGet.Miss() if value is None else CacheGet.Hit(value)
+
+    async def set(self, cache_name: str, key: str, value: bytes, ttl=None):
+        await asyncio.sleep(self.rtt_seconds)
+        self.store[key] = value
+        return CacheSet.Success()
+
+    async def delete(self, cache_name: str, key: str):
+        await asyncio.sleep(self.rtt_seconds)
+        self.store.pop(key, None)
+        return CacheDelete.Success()
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+
+async def setup(client: httpx.AsyncClient) -> tuple[dict, list[int]]:
+    """Register a user with a page of associations, returns its headers and the ids"""
+    user = (await client.post("/users/", json={
+        "first_name": "Bench", "last_name": "User", "email": "bench@example.com", "password": "password",
+    })).json()
+    token = (await client.post("/login/", data={"email": "bench@example.com", "password": "password"})).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    generated = []
+    for i in range(20):
+        vocabulary = (await client.post("/vocabularies/", json={"word": f"word{i}", "meaning": f"meaning{i}"}, headers=headers)).json()
+        generated.append((vocabulary["id"], schemas.AssociationSchema(vocabulary=f"word{i}", options={"RIGHT": "right", "wrong": "wrong"})))
+    async with async_session() as session:
+        association_ids = await insert_associations(session, user["id"], generated)
+        await session.commit()
+    return headers, association_ids
+
+
+async def measure(client: httpx.AsyncClient, headers: dict, association_ids: list[int], requests: int) -> list[float]:
+    """Latency in milliseconds of each request, alternating listing and detail reads"""
+    latencies = []
+    for i in range(requests):
+        url = "/associations/" if i % 2 else f"/associations/{association_ids[i % len(association_ids)]}"
+        start = time.perf_counter()
+        response = await client.get(url, headers=headers)
+        latencies.append((time.perf_counter() - start) * 1000)
+        response.raise_for_status()
+    return latencies
+
+
+def report(name: str, latencies: list[float]) -> None:
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{name:<12} mean {statistics.mean(latencies):7.2f} ms  p50 {percentiles[49]:7.2f} ms  p95 {percentiles[94]:7.2f} ms")
+
+
+async def main(requests: int, connect_seconds: float, rtt_seconds: float) -> None:
+    store = {}
+    shared = MomentoCache(await InMemoryMomento.create(store, connect_seconds, rtt_seconds), ASSOCIATIONS_CACHE_NAME)
+
+    async def per_request_cache():
+        # What the app did before the lifespan client: connect, use, close
+        cache = MomentoCache(await InMemoryMomento.create(store, connect_seconds, rtt_seconds), ASSOCIATIONS_CACHE_NAME)
+        try:
+            yield cache
+        finally:
+            await cache.close()
+
+    engine.echo = False
+    async with lifespan(app):
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://benchmark") as client:
+            headers, association_ids = await setup(client)
+            print(f"{requests} requests, connect {connect_seconds * 1000:g} ms, round trip {rtt_seconds * 1000:g} ms")
+            for name, dependency in (("per-request", per_request_cache), ("shared", lambda: shared)):
+                app.dependency_overrides[get_cache] = dependency
+                await measure(client, headers, association_ids, len(association_ids) * 2)  # fill the cache
+                report(name, await measure(client, headers, association_ids, requests))
+            app.dependency_overrides.clear()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--connect-ms", type=float, default=50.0, help="cost of creating a client")
+    parser.add_argument("--rtt-ms", type=float, default=1.0, help="cost of each cache call")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.connect_ms / 1000, args.rtt_ms / 1000))
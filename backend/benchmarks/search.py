@@ -0,0 +1,92 @@
+"""Vocabulary search latency over a large synthetic vocabulary table.
+
+Fills a SQLite database created from the models (FTS5 table and triggers
+included) with ``--words`` random words, then times
+``app.search.search_vocabularies`` for short and long prefixes, multi-word
+queries and a miss, first page and next page. A ``LIKE '%...%'`` scan for
+a rare word is timed for comparison. The database is kept, pass the same
+``--database`` to rerun the queries without filling it again.
+
+    python -m benchmarks.search [--words 1000000] [--database PATH]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import time
+
+# The app reads its settings on import
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-long-enough-for-hs256")
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app import models
+from app.search import search_vocabularies
+
+SYLLABLES = ["ka", "ro", "mi", "ta", "ne", "po", "lu", "sa", "ve", "di", "an", "el", "or", "is", "um", "pre", "con", "ex"]
+QUERIES = ["ka", "kar", "karo", "karomi", "romi ta", "pretaexlu", "zz"]
+PAGE_SIZE = 50
+
+
+def random_word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 6)))
+
+
+def fill(path: str, words: int) -> None:
+    """Insert random unique words through the triggers, in chunks"""
+    rng = random.Random(1)
+    db = sqlite3.connect(path)
+    start = time.perf_counter()
+    count = db.execute("SELECT count(*) FROM vocabulary").fetchone()[0]
+    while count < words:
+        rows = []
+        for _ in range(min(10_000, words - count)):
+            word = random_word(rng)
+            rows.append((word, f"{random_word(rng)} {random_word(rng)}", word))
+        db.executemany("INSERT OR IGNORE INTO vocabulary (word, meaning, normalized_word) VALUES (?, ?, ?)", rows)
+        db.commit()
+        count = db.execute("SELECT count(*) FROM vocabulary").fetchone()[0]
+    db.close()
+    print(f"{count} vocabularies, filled in {time.perf_counter() - start:.1f} s")
+
+
+async def timed(coroutine_factory, repeat: int = 5):
+    """Median milliseconds of ``repeat`` runs, and the last result"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await coroutine_factory()
+        timings.append((time.perf_counter() - start) * 1000)
+    return statistics.median(timings), result
+
+
+async def main(words: int, path: str) -> None:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+    fill(path, words)
+
+    session_factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with session_factory() as session:
+        for query in QUERIES:
+            first_ms, (rows, cursor) = await timed(lambda: search_vocabularies(session, query, PAGE_SIZE))
+            next_page = f"next page {(await timed(lambda: search_vocabularies(session, query, PAGE_SIZE, cursor)))[0]:7.1f} ms" if cursor else ""
+            print(f"q={query!r:<13} {len(rows):3} rows  first page {first_ms:7.1f} ms  {next_page}")
+        like_ms, _ = await timed(lambda: session.scalars(
+            select(models.Vocabulary).where(models.Vocabulary.word.like("%pretaexlu%")).limit(PAGE_SIZE)
+        ), repeat=1)
+        print(f"LIKE '%pretaexlu%' first page {like_ms:7.1f} ms")
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=1_000_000)
+    parser.add_argument("--database", default=os.path.join(tempfile.gettempdir(), "vocabulary-search-benchmark.db"))
+    args = parser.parse_args()
+    asyncio.run(main(args.words, args.database))
@@ -0,0 +1,65 @@
+"""Serialization cost of a page of associations, per 1,000 items.
+
+Compares the precompiled ``schemas.dump_json`` path with what a
+``response_model`` route does with the same ORM objects: validate them
+against the model, turn the result into plain Python with
+``jsonable_encoder`` and encode that with ``json.dumps`` (JSONResponse).
+Runs in-process on transient ORM objects, no database or server needed.
+
+    python -m benchmarks.serialization [--items N] [--repeat R]
+"""
+import argparse
+import os
+import statistics
+import timeit
+
+# The app reads its settings on import
+os.environ.setdefault("SECRET_KEY", "benchmark-secret-key-long-enough-for-hs256")
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app import models, schemas
+
+
+def make_associations(count: int) -> list[models.Association]:
+    user = models.User(id=1, first_name="Bench", last_name="User", email="bench@example.com", password="x")
+    associations = []
+    for i in range(count):
+        association = models.Association(
+            id=i + 1, status=models.AssociationStatus.PENDING, user=user,
+            number_of_times_played=i % 7, number_of_times_correct=i % 5, number_of_times_incorrect=i % 3,
+            vocabulary=models.Vocabulary(id=i + 1, word=f"word{i}", meaning=f"the meaning of word {i}"),
+        )
+        association.options = [
+            models.Option(id=3 * i + j, option=option, meaning=f"meaning of {option}", is_correct=option.isupper(), association_id=i + 1)
+            for j, option in enumerate((f"RIGHT{i}", f"wrong{i}", f"other{i}"))
+        ]
+        associations.append(association)
+    return associations
+
+
+def response_model_path(page: dict) -> bytes:
+    validated = schemas.association_page_adapter.validate_python(page, from_attributes=True)
+    return JSONResponse(jsonable_encoder(validated)).body
+
+
+def dump_json_path(page: dict) -> bytes:
+    return schemas.dump_json(schemas.association_page_adapter, page)
+
+
+def main(items: int, repeat: int) -> None:
+    page = {"items": make_associations(items), "next_cursor": None}
+    print(f"{items} associations, best and median of {repeat} runs, in ms per 1,000 associations")
+    for name, serialize in (("response_model", response_model_path), ("dump_json", dump_json_path)):
+        timings = [seconds * 1000 * 1000 / items for seconds in timeit.repeat(lambda: serialize(page), number=1, repeat=repeat)]
+        print(f"{name:<15} best {min(timings):7.2f} ms  median {statistics.median(timings):7.2f} ms  {len(serialize(page))} bytes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--items", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    main(args.items, args.repeat)
@@ -0,0 +1,77 @@
+"""Throughput of a running server under many concurrent clients.
+
+Each client loops over authenticated vocabulary reads, with one vocabulary
+insert every ``--write-every`` requests, for ``--duration`` seconds. Start
+the server first, one worker and without access logs, e.g.
+
+    uvicorn app.main:app --port 8000 --no-access-log > /dev/null &
+    python -m benchmarks.throughput --url http://127.0.0.1:8000 [--clients 100]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+
+import httpx
+
+
+async def setup(client: httpx.AsyncClient) -> tuple[dict, int]:
+    """Register a throwaway user and a vocabulary to read, returns the headers and its id"""
+    email = f"load-{uuid.uuid4().hex}@example.com"
+    response = await client.post("/users/", json={"first_name": "Load", "last_name": "Test", "email": email, "password": "password"})
+    response.raise_for_status()
+    response = await client.post("/login/", data={"email": email, "password": "password"})
+    response.raise_for_status()
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    response = await client.post("/vocabularies/", json={"word": f"load-{uuid.uuid4().hex[:8]}", "meaning": "load"}, headers=headers)
+    response.raise_for_status()
+    return headers, response.json()["id"]
+
+
+async def run_client(client: httpx.AsyncClient, headers: dict, vocabulary_id: int, write_every: int, deadline: float,
+                     latencies: list[float], errors: list[str]) -> None:
+    i = 0
+    while time.perf_counter() < deadline:
+        i += 1
+        start = time.perf_counter()
+        try:
+            if i % write_every == 0:
+                response = await client.post("/vocabularies/", json={"word": uuid.uuid4().hex[:16], "meaning": "load"}, headers=headers)
+            else:
+                response = await client.get(f"/vocabularies/{vocabulary_id}/", headers=headers)
+            response.raise_for_status()
+        except httpx.HTTPError as error:
+            errors.append(repr(error))
+            continue
+        latencies.append((time.perf_counter() - start) * 1000)
+
+
+async def main(url: str, clients: int, duration: float, write_every: int) -> None:
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        headers, vocabulary_id = await setup(client)
+        latencies: list[float] = []
+        errors: list[str] = []
+        start = time.perf_counter()
+        await asyncio.gather(*(
+            run_client(client, headers, vocabulary_id, write_every, start + duration, latencies, errors)
+            for _ in range(clients)
+        ))
+        elapsed = time.perf_counter() - start
+
+    percentiles = statistics.quantiles(latencies, n=100)
+    print(f"{clients} clients, {elapsed:.1f} s: {len(latencies)} requests, {len(latencies) / elapsed:.1f} req/s, {len(errors)} errors")
+    print(f"latency mean {statistics.mean(latencies):.1f} ms  p50 {percentiles[49]:.1f} ms  p95 {percentiles[94]:.1f} ms  p99 {percentiles[98]:.1f} ms")
+    if errors:
+        print(f"first error: {errors[0]}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    parser.add_argument("--write-every", type=int, default=5, help="one insert every N requests of a client")
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.clients, args.duration, args.write_every))
@@ -0,0 +1,108 @@
+from contextlib import contextmanager
+import os
+import tempfile
+
+import httpx
+import pytest
+from sqlalchemy import event
+
+# Settings are read when the app is imported: keep it offline
+os.environ.setdefault("SECRET_KEY", "test-secret-key-long-enough-for-hs256")
+os.environ.setdefault("GEMINI_API_KEY", "test")
+os.environ.setdefault("CACHE_BACKEND", "memory")
+# The app's engine is created on import, point it at a throwaway database
+os.environ.setdefault("CHAPERONE_SQLITE_FILE_NAME", os.path.join(tempfile.mkdtemp(), "test.db"))
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def client(anyio_backend):
+    """The app, with its lifespan running, on an empty database"""
+    from app.core.database import engine
+    from app.main import app, lifespan
+    from app.models import Base
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+    try:
+        async with lifespan(app):
+            async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+                yield client
+    finally:
+        # Leave no pooled connection holding the database for the next test
+        await engine.dispose()
+
+
+@pytest.fixture
+async def user(client):
+    """A freshly registered user, as returned by the API"""
+    response = await client.post("/users/", json={
+        "first_name": "Test", "last_name": "User", "email": "test@example.com", "password": "password",
+    })
+    assert response.status_code == 201
+    return response.json()
+
+
+@pytest.fixture
+async def auth_headers(client, user):
+    """Authorization headers of ``user``"""
+    response = await client.post("/login/", data={"email": user["email"], "password": "password"})
+    assert response.status_code == 200
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture
+def create_associations(client, user, auth_headers):
+    """Create associations of ``user`` on new vocabularies, without the LLM.
+
+    Returns an async function taking the number of associations to create
+    and returning their ids.
+    """
+    from app import schemas
+    from app.core.cache import invalidate_namespace
+    from app.core.database import async_session
+    from app.main import app, insert_associations
+
+    created = 0
+
+    async def create(count: int) -> list[int]:
+        nonlocal created
+        generated = []
+        for i in range(created, created + count):
+            response = await client.post("/vocabularies/", json={"word": f"word{i}", "meaning": f"meaning{i}"}, headers=auth_headers)
+            assert response.status_code == 201
+            options = schemas.AssociationSchema(vocabulary=f"word{i}", options={f"RIGHT{i}": "right", f"wrong{i}": "wrong"})
+            generated.append((response.json()["id"], options))
+        created += count
+        async with async_session() as session:
+            association_ids = await insert_associations(session, user["id"], generated)
+            await session.commit()
+        await invalidate_namespace(app.state.cache, f"user_associations_{user['id']}")
+        return association_ids
+
+    return create
+
+
+@pytest.fixture
+def recorded_queries():
+    """Context manager collecting the statements the app's engine runs within it"""
+    from app.core.database import engine
+
+    @contextmanager
+    def record_queries():
+        statements = []
+
+        def record(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        event.listen(engine.sync_engine, "before_cursor_execute", record)
+        try:
+            yield statements
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+    return record_queries
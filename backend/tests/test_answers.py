@@ -0,0 +1,33 @@
+import asyncio
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_concurrent_answers_are_all_counted(client, user, auth_headers, create_associations):
+    [association_id] = await create_associations(1)
+
+    # 40 correct and 20 incorrect single answers racing 20 batches of two correct answers
+    singles = [
+        client.put(f"/associations/{association_id}/{'correct' if i % 3 else 'incorrect'}", headers=auth_headers)
+        for i in range(60)
+    ]
+    batches = [
+        client.post("/associations/answers", json={"answers": [{"association_id": association_id, "correct": True}] * 2}, headers=auth_headers)
+        for _ in range(20)
+    ]
+    responses = await asyncio.gather(*singles, *batches)
+    assert {response.status_code for response in responses} == {200}
+
+    association = (await client.get(f"/associations/{association_id}", headers=auth_headers)).json()
+    assert association["number_of_times_played"] == 100
+    assert association["number_of_times_correct"] == 80
+    assert association["number_of_times_incorrect"] == 20
+
+    stats = (await client.get(f"/users/{user['id']}/stats", headers=auth_headers)).json()
+    assert (stats["played"], stats["correct"], stats["incorrect"], stats["mastered"]) == (100, 80, 20, 1)
+
+    # The insert and every answer took their own revision
+    changes = (await client.get("/associations/changes", params={"since": 0}, headers=auth_headers)).json()
+    assert changes["cursor"] == 1 + 100
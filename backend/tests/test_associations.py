@@ -0,0 +1,26 @@
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_query_count_does_not_grow_with_associations(client, auth_headers, create_associations, recorded_queries):
+    few = await create_associations(5)
+    with recorded_queries() as list_few:
+        response = await client.get("/associations/", params={"limit": 100}, headers=auth_headers)
+    assert len(response.json()["items"]) == 5
+    with recorded_queries() as detail_few:
+        response = await client.get(f"/associations/{few[0]}", headers=auth_headers)
+    assert response.status_code == 200
+
+    many = await create_associations(50)
+    with recorded_queries() as list_many:
+        response = await client.get("/associations/", params={"limit": 100}, headers=auth_headers)
+    items = response.json()["items"]
+    assert len(items) == 55
+    assert all(item["user"] and item["vocabulary"] and len(item["options"]) == 2 for item in items)
+    with recorded_queries() as detail_many:
+        response = await client.get(f"/associations/{many[-1]}", headers=auth_headers)
+    assert response.status_code == 200
+
+    assert list_few and len(list_many) == len(list_few)
+    assert detail_few and len(detail_many) == len(detail_few)
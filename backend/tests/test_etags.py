@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from app import generation_cache
+
+pytestmark = pytest.mark.anyio
+
+
+class StubGenerator:
+    async def generate_many(self, vocabularies, number_of_options, max_concurrency):
+        return [{"vocabulary": vocabulary, "options": {"GLAD": "pleased", "sad": "unhappy"}} for vocabulary in vocabularies]
+
+    async def generate_batched(self, vocabularies, number_of_options, batch_size, max_concurrency, max_retries):
+        return await self.generate_many(vocabularies, number_of_options, max_concurrency)
+
+
+@pytest.fixture(autouse=True)
+def generator(monkeypatch):
+    monkeypatch.setattr(generation_cache, "get_association_generator", StubGenerator)
+
+
+@pytest.fixture
+def etag_of(client, auth_headers):
+    async def etag_of(url, **params):
+        response = await client.get(url, params=params, headers=auth_headers)
+        assert response.status_code == 200
+        return response.headers["ETag"]
+    return etag_of
+
+
+@pytest.fixture
+def assert_not_modified(client, auth_headers, recorded_queries):
+    async def assert_not_modified(url, etag, **params):
+        with recorded_queries() as statements:
+            response = await client.get(url, params=params, headers={**auth_headers, "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+        assert statements == []
+    return assert_not_modified
+
+
+async def test_association_writes_change_the_etags(client, auth_headers, create_associations, etag_of, assert_not_modified):
+    [association_id] = await create_associations(1)
+    vocabulary_id = (await client.post("/vocabularies/", json={"word": "happy", "meaning": "glad"}, headers=auth_headers)).json()["id"]
+    urls = ["/associations/", f"/associations/{association_id}"]
+
+    async def create_through_job():
+        response = await client.post("/associations/", json={"vocabulary_id": vocabulary_id}, headers=auth_headers)
+        assert response.status_code == 202
+        # The namespace is bumped by the job's after_commit, once the worker ran it
+        for _ in range(500):
+            if await etag_of(urls[0]) != etags[urls[0]]:
+                return
+            await asyncio.sleep(0.01)
+
+    writes = {
+        "correct": lambda: client.put(f"/associations/{association_id}/correct", headers=auth_headers),
+        "incorrect": lambda: client.put(f"/associations/{association_id}/incorrect", headers=auth_headers),
+        "answers": lambda: client.post("/associations/answers", json={"answers": [{"association_id": association_id, "correct": True}]}, headers=auth_headers),
+        "batch": lambda: client.post("/associations/batch", json={"vocabulary_ids": [vocabulary_id]}, headers=auth_headers),
+        "job": create_through_job,
+    }
+    seen = set()
+    for name, write in writes.items():
+        etags = {url: await etag_of(url) for url in urls}
+        for url, etag in etags.items():
+            await assert_not_modified(url, etag)
+        await write()
+        for url, etag in etags.items():
+            assert await etag_of(url) != etag, f"{name} kept the ETag of {url}"
+        seen.update(etags.values())
+    assert len(seen) == len(writes) * len(urls)
+
+
+async def test_vocabulary_writes_change_the_etags(client, auth_headers, etag_of, assert_not_modified):
+    vocabulary_id = (await client.post("/vocabularies/", json={"word": "Haus", "meaning": "house"}, headers=auth_headers)).json()["id"]
+    reads = [("/vocabularies/", {}), (f"/vocabularies/{vocabulary_id}/", {}), ("/vocabularies/search", {"q": "haus"})]
+
+    for write in (
+        lambda: client.post("/vocabularies/", json={"word": "Baum", "meaning": "tree"}, headers=auth_headers),
+        lambda: client.post("/vocabularies/bulk", json=[{"word": "Hund", "meaning": "dog"}], headers=auth_headers),
+    ):
+        etags = [await etag_of(url, **params) for url, params in reads]
+        for (url, params), etag in zip(reads, etags):
+            await assert_not_modified(url, etag, **params)
+        assert (await write()).status_code in (200, 201)
+        for (url, params), etag in zip(reads, etags):
+            assert await etag_of(url, **params) != etag
+
+
+async def test_existing_vocabulary_keeps_the_etag(client, auth_headers, etag_of):
+    await client.post("/vocabularies/", json={"word": "Haus", "meaning": "house"}, headers=auth_headers)
+    etag = await etag_of("/vocabularies/")
+    response = await client.post("/vocabularies/", json={"word": "haus", "meaning": "house"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert await etag_of("/vocabularies/") == etag
@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import select
+
+from app import generation_cache, models
+from app.core.config import settings
+from app.core.database import async_session
+
+pytestmark = pytest.mark.anyio
+
+GENERATED = {
+    "good": {"HAPPY": "glad", "sad": "unhappy"},
+    "empty": {},
+    "lowercase": {"happy": "glad", "sad": "unhappy"},
+}
+
+
+class StubGenerator:
+    """Returns the raw LLM output of GENERATED, unvalidated"""
+
+    def __init__(self):
+        self.calls = []
+
+    def _outputs(self, vocabularies):
+        self.calls.append(list(vocabularies))
+        return [{"vocabulary": vocabulary, "options": GENERATED[vocabulary]} for vocabulary in vocabularies]
+
+    async def generate_many(self, vocabularies, number_of_options, max_concurrency):
+        return self._outputs(vocabularies)
+
+    async def generate_batched(self, vocabularies, number_of_options, batch_size, max_concurrency, max_retries):
+        return self._outputs(vocabularies)
+
+
+@pytest.fixture
+def generator(monkeypatch):
+    stub = StubGenerator()
+    monkeypatch.setattr(generation_cache, "get_association_generator", lambda: stub)
+    return stub
+
+
+@pytest.mark.parametrize("batch_size", [1, 10])
+async def test_options_without_a_correct_answer_fail_per_word(client, auth_headers, generator, monkeypatch, batch_size):
+    monkeypatch.setattr(settings, "GENERATION_BATCH_SIZE", batch_size)
+    vocabulary_ids = {}
+    for word in GENERATED:
+        response = await client.post("/vocabularies/", json={"word": word, "meaning": word}, headers=auth_headers)
+        vocabulary_ids[word] = response.json()["id"]
+
+    response = await client.post("/associations/batch", json={"vocabulary_ids": list(vocabulary_ids.values())}, headers=auth_headers)
+    assert response.status_code == 201
+    body = response.json()
+    assert (body["created"], body["failed"]) == (1, 2)
+    errors = {result["vocabulary_id"]: result["error"] for result in body["results"]}
+    assert errors == {vocabulary_ids["good"]: None, vocabulary_ids["empty"]: "Generation failed", vocabulary_ids["lowercase"]: "Generation failed"}
+
+    # Only the valid generation is cached, the others are asked for again
+    async with async_session() as session:
+        assert (await session.scalars(select(models.GeneratedOptions.word))).all() == ["good"]
+    await client.post("/associations/batch", json={"vocabulary_ids": list(vocabulary_ids.values())}, headers=auth_headers)
+    assert sorted(generator.calls[-1]) == ["empty", "lowercase"]
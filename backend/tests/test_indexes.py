@@ -0,0 +1,43 @@
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app import models
+from app.main import ASSOCIATION_READ_OPTIONS
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def connection(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'indexes.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(models.Base.metadata.create_all)
+        yield conn
+    await engine.dispose()
+
+
+async def query_plan(connection, query) -> str:
+    sql = query.compile(dialect=connection.dialect, compile_kwargs={"literal_binds": True})
+    rows = (await connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")).all()
+    return "\n".join(row[-1] for row in rows)
+
+
+async def test_pending_listing_uses_the_user_status_index(connection):
+    # The GET /associations/ query
+    plan = await query_plan(connection, select(models.Association).options(*ASSOCIATION_READ_OPTIONS).where(
+        models.Association.user_id == 1, models.Association.status == "pending"
+    ).order_by(models.Association.id.desc()).limit(51))
+    assert "USING INDEX ix_association_user_id_status_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+async def test_option_lookup_uses_the_association_index(connection):
+    # The selectin load of the options of a page of associations
+    plan = await query_plan(connection, select(models.Option).where(models.Option.association_id.in_([1, 2, 3])))
+    assert "USING INDEX ix_option_association_id" in plan
+
+
+async def test_word_lookup_uses_the_word_index(connection):
+    plan = await query_plan(connection, select(models.Vocabulary).where(models.Vocabulary.word == "Haus"))
+    assert "USING INDEX ix_vocabulary_word" in plan
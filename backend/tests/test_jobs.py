@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from app.core.jobs import JobQueue
+from app.models import Base, Job, JobStatus, User, utcnow
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as session:
+        session.add(User(id=1, first_name="a", last_name="b", email="a@example.com", password="x"))
+        await session.commit()
+    yield factory
+    await engine.dispose()
+
+
+def make_queue(session_factory, **options):
+    return JobQueue(session_factory, **{
+        "workers": 1, "poll_interval_seconds": 0.01, "lease_seconds": 300,
+        "max_attempts": 3, "retry_backoff_seconds": 60, **options,
+    })
+
+
+async def wait_for_status(session_factory, job_id, *statuses, timeout=5.0):
+    async def _poll():
+        while True:
+            async with session_factory() as session:
+                job = await session.get(Job, job_id)
+                if job.status in statuses:
+                    return job
+            await asyncio.sleep(0.01)
+    return await asyncio.wait_for(_poll(), timeout)
+
+
+async def enqueue(queue, session_factory, kind="test"):
+    async with session_factory() as session:
+        return (await queue.enqueue(session, kind, {}, user_id=1)).id
+
+
+async def test_worker_survives_a_failing_after_commit_hook(session_factory):
+    calls = []
+
+    async def after_commit(job):
+        calls.append(job.id)
+        if len(calls) == 1:
+            raise RuntimeError("cache down")
+
+    queue = make_queue(session_factory)
+    queue.register("test", lambda session, job: asyncio.sleep(0, {"ok": True}), after_commit)
+    queue.start()
+    try:
+        first = await enqueue(queue, session_factory)
+        await wait_for_status(session_factory, first, JobStatus.SUCCEEDED)
+        second = await enqueue(queue, session_factory)
+        await wait_for_status(session_factory, second, JobStatus.SUCCEEDED)
+    finally:
+        await queue.stop()
+    assert calls == [first, second]
+
+
+async def test_worker_survives_a_failing_claim(session_factory):
+    queue = make_queue(session_factory)
+    queue.register("test", lambda session, job: asyncio.sleep(0, {"ok": True}))
+    claim = queue._claim
+    failures = []
+
+    async def flaky_claim():
+        if not failures:
+            failures.append(True)
+            raise RuntimeError("database is locked")
+        return await claim()
+
+    queue._claim = flaky_claim
+    queue.start()
+    try:
+        job_id = await enqueue(queue, session_factory)
+        await wait_for_status(session_factory, job_id, JobStatus.SUCCEEDED)
+    finally:
+        await queue.stop()
+    assert failures
+
+
+async def test_failed_attempt_is_retried_after_a_backoff(session_factory):
+    async def handler(session, job):
+        raise RuntimeError("LLM unavailable")
+
+    queue = make_queue(session_factory)
+    queue.register("test", handler)
+    job_id = await enqueue(queue, session_factory)
+
+    await queue._run(await queue._claim())
+    async with session_factory() as session:
+        job = await session.get(Job, job_id)
+    assert job.status == JobStatus.QUEUED
+    assert job.attempts == 1
+    assert job.error == "LLM unavailable"
+    assert job.not_before > utcnow()
+    # Not claimable again until the backoff has passed
+    assert await queue._claim() is None
+
+
+async def test_job_fails_after_max_attempts(session_factory):
+    async def handler(session, job):
+        raise RuntimeError("LLM unavailable")
+
+    queue = make_queue(session_factory, max_attempts=2, retry_backoff_seconds=0)
+    queue.register("test", handler)
+    job_id = await enqueue(queue, session_factory)
+    for _ in range(2):
+        await queue._run(await queue._claim())
+
+    async with session_factory() as session:
+        job = await session.get(Job, job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.attempts == 2
+    assert await queue._claim() is None
+
+
+async def test_failed_commit_requeues_the_job(session_factory):
+    async def handler(session, job):
+        # Not JSON serializable: the handler succeeds, the commit fails
+        return {"value": object()}
+
+    queue = make_queue(session_factory)
+    queue.register("test", handler)
+    job_id = await enqueue(queue, session_factory)
+    await queue._run(await queue._claim())
+
+    async with session_factory() as session:
+        job = await session.scalar(select(Job).where(Job.id == job_id))
+    assert job.status == JobStatus.QUEUED
+    assert job.result is None
+    assert job.not_before is not None
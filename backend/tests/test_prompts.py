@@ -0,0 +1,71 @@
+import pytest
+from langchain_core.language_models import FakeListChatModel
+
+from app.prompts import AssociationGenerator
+
+pytestmark = pytest.mark.anyio
+
+
+def item(vocabulary, options=None):
+    return {"vocabulary": vocabulary, "options": {"GLAD": "pleased", "sad": "unhappy"} if options is None else options}
+
+
+class StubBatchChain:
+    """Answers each prompt with the next prepared list of items, records the words asked for"""
+
+    def __init__(self, *outputs):
+        self.outputs = list(outputs)
+        self.prompts = []
+
+    async def ainvoke(self, inputs):
+        self.prompts.append(inputs["vocabularies"].split("\n"))
+        output = self.outputs.pop(0)
+        if isinstance(output, Exception):
+            raise output
+        return {"associations": output}
+
+
+def generator_with(*outputs):
+    generator = AssociationGenerator(llm=FakeListChatModel(responses=["{}"]))
+    generator.batch_chain = StubBatchChain(*outputs)
+    return generator
+
+
+async def generate(generator, vocabularies, max_retries=0, batch_size=10):
+    return await generator.generate_batched(vocabularies, 2, batch_size=batch_size, max_concurrency=2, max_retries=max_retries)
+
+
+async def test_missing_and_invalid_items_fail_on_their_own():
+    generator = generator_with([item("happy"), item("tired", options={}), {"vocabulary": "angry"}, item("unrequested")])
+
+    happy, tired, angry, calm = await generate(generator, ["happy", "tired", "angry", "calm"])
+    assert happy == item("happy")
+    assert all(isinstance(result, Exception) for result in (tired, angry, calm))
+
+
+async def test_words_echoed_with_another_case_are_matched():
+    generator = generator_with([item(" HAPPY "), item("straße")])
+
+    happy, strasse = await generate(generator, ["Happy", "Straße"])
+    assert happy == item(" HAPPY ")
+    assert strasse == item("straße")
+
+
+async def test_retry_prompts_only_the_failed_words():
+    generator = generator_with(
+        [item("happy"), item("tired", options={"sleepy": "lowercase only"})],
+        [item("tired"), item("calm")],
+    )
+
+    results = await generate(generator, ["happy", "tired", "calm"], max_retries=1)
+    assert results == [item("happy"), item("tired"), item("calm")]
+    assert generator.batch_chain.prompts == [["happy", "tired", "calm"], ["tired", "calm"]]
+
+
+async def test_failed_prompt_fails_its_group_until_retries_run_out():
+    generator = generator_with(RuntimeError("LLM down"), [item("calm")], RuntimeError("LLM down"))
+
+    happy, calm = await generate(generator, ["happy", "calm"], max_retries=1, batch_size=1)
+    assert isinstance(happy, RuntimeError)
+    assert calm == item("calm")
+    assert generator.batch_chain.prompts == [["happy"], ["calm"], ["happy"]]
@@ -0,0 +1,52 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import models
+from app.core.database import async_session
+
+pytestmark = pytest.mark.anyio
+
+
+async def answer(client, auth_headers, association_id, *correct):
+    response = await client.post("/associations/answers", json={
+        "answers": [{"association_id": association_id, "correct": value} for value in correct],
+    }, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json()["applied"] == len(correct)
+
+
+async def test_answers_schedule_the_next_review(client, auth_headers, create_associations):
+    [association_id] = await create_associations(1)
+    response = await client.get("/reviews/due", headers=auth_headers)
+    assert [item["id"] for item in response.json()["items"]] == [association_id]
+
+    await answer(client, auth_headers, association_id, True, True, True)
+    async with async_session() as session:
+        association = await session.get(models.Association, association_id)
+    assert association.interval_days == pytest.approx(6.0 * (models.INITIAL_EASE + 2 * models.EASE_STEP_CORRECT))
+    assert association.ease == pytest.approx(models.INITIAL_EASE + 3 * models.EASE_STEP_CORRECT)
+
+    response = await client.get("/reviews/due", headers=auth_headers)
+    queue = response.json()
+    assert queue["items"] == []
+    due_in = datetime.fromisoformat(queue["next_review_at"]) - models.utcnow()
+    assert timedelta(days=15) < due_in <= timedelta(days=association.interval_days)
+
+    await answer(client, auth_headers, association_id, False)
+    async with async_session() as session:
+        association = await session.get(models.Association, association_id)
+    assert association.interval_days == 0.0
+    assert association.next_review_at - models.utcnow() <= models.RELEARN_DELAY
+
+
+async def test_interval_is_capped(client, auth_headers, create_associations):
+    [association_id] = await create_associations(1)
+
+    await answer(client, auth_headers, association_id, *[True] * 50)
+    async with async_session() as session:
+        association = await session.get(models.Association, association_id)
+    assert association.interval_days == models.MAX_INTERVAL_DAYS
+
+    response = await client.get("/reviews/due", headers=auth_headers)
+    assert response.status_code == 200
@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import delete, update
+
+from app import models
+from app.core.database import async_session
+
+pytestmark = pytest.mark.anyio
+
+
+async def search(client, auth_headers, q, **params):
+    response = await client.get("/vocabularies/search", params={"q": q, **params}, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+async def words(client, auth_headers, q, **params):
+    return [item["word"] for item in (await search(client, auth_headers, q, **params))["items"]]
+
+
+async def create(client, auth_headers, word, meaning):
+    response = await client.post("/vocabularies/", json={"word": word, "meaning": meaning}, headers=auth_headers)
+    assert response.status_code == 201
+    return response.json()["id"]
+
+
+async def test_index_follows_inserts_updates_and_deletes(client, auth_headers):
+    vocabulary_id = await create(client, auth_headers, "Haus", "house")
+    response = await client.post("/vocabularies/bulk", json=[{"word": "Baum", "meaning": "tree"}, {"word": "Hund", "meaning": "dog"}], headers=auth_headers)
+    assert response.json()["created"] == 2
+    assert await words(client, auth_headers, "haus") == ["Haus"]
+    assert await words(client, auth_headers, "tree") == ["Baum"]
+
+    async with async_session() as session:
+        await session.execute(update(models.Vocabulary).where(models.Vocabulary.id == vocabulary_id).values(word="Hütte", meaning="hut"))
+        await session.commit()
+    assert await words(client, auth_headers, "haus") == []
+    assert await words(client, auth_headers, "hutte") == ["Hütte"]
+
+    async with async_session() as session:
+        await session.execute(delete(models.Vocabulary).where(models.Vocabulary.word == "Hund"))
+        await session.commit()
+    assert await words(client, auth_headers, "dog") == []
+
+
+async def test_prefix_matches_ranked_word_before_meaning(client, auth_headers):
+    await create(client, auth_headers, "Kaffee", "coffee")
+    await create(client, auth_headers, "Tasse", "a cup for kaffee")
+    await create(client, auth_headers, "Café", "coffee house")
+    await create(client, auth_headers, "Tee", "tea")
+
+    assert await words(client, auth_headers, "kaf") == ["Kaffee", "Tasse"]
+    # Case and diacritics insensitive
+    assert await words(client, auth_headers, "CAFE") == ["Café"]
+    # Every term has to match
+    assert await words(client, auth_headers, "coffee hou") == ["Café"]
+    # Query syntax is searched as text, not interpreted
+    assert await words(client, auth_headers, 'tee OR "kaffee') == []
+
+
+async def test_cursor_pages_through_every_match_once(client, auth_headers):
+    for i in range(7):
+        await create(client, auth_headers, f"Wort{i}", "word" if i % 2 else "a word among words")
+
+    everything = await words(client, auth_headers, "wor", limit=50)
+    assert len(everything) == 7
+
+    paged, cursor = [], None
+    while True:
+        page = await search(client, auth_headers, "wor", limit=3, **({"cursor": cursor} if cursor else {}))
+        paged.extend(item["word"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            break
+    assert paged == everything
+
+
+async def test_bad_cursor_is_rejected(client, auth_headers):
+    await create(client, auth_headers, "Haus", "house")
+    response = await client.get("/vocabularies/search", params={"q": "haus", "cursor": "not-a-cursor"}, headers=auth_headers)
+    assert response.status_code == 422
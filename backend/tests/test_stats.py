@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy import select, update
+
+from app import models
+from app.core.database import async_session
+from app.stats import rebuild
+
+pytestmark = pytest.mark.anyio
+
+
+async def stats_rows():
+    async with async_session() as session:
+        users = (await session.execute(select(models.UserStats.__table__))).all()
+        vocabularies = (await session.execute(select(models.VocabularyStats.__table__))).all()
+    return sorted(users), sorted(vocabularies)
+
+
+async def test_rebuild_restores_what_the_answer_paths_counted(client, user, auth_headers, create_associations):
+    first, second = await create_associations(2)
+    for outcome in ("correct", "correct", "incorrect"):
+        assert (await client.put(f"/associations/{first}/{outcome}", headers=auth_headers)).status_code == 200
+    answers = [{"association_id": first, "correct": True}] + [{"association_id": second, "correct": True}] * 3
+    assert (await client.post("/associations/answers", json={"answers": answers}, headers=auth_headers)).status_code == 200
+
+    stats = (await client.get(f"/users/{user['id']}/stats", headers=auth_headers)).json()
+    assert (stats["associations"], stats["played"], stats["correct"], stats["incorrect"], stats["mastered"]) == (2, 7, 6, 1, 2)
+    counted = await stats_rows()
+    assert await rebuild(check_only=True) == 0
+
+    async with async_session() as session:
+        await session.execute(update(models.UserStats).where(models.UserStats.user_id == user["id"]).values(played=999, mastered=0))
+        await session.execute(update(models.VocabularyStats).where(models.VocabularyStats.vocabulary_id == 1).values(correct=0))
+        await session.commit()
+    corrupted = await stats_rows()
+
+    # Checking reports both rows and changes nothing
+    assert await rebuild(check_only=True) == 2
+    assert await stats_rows() == corrupted
+
+    assert await rebuild() == 2
+    assert await stats_rows() == counted
+    assert await rebuild(check_only=True) == 0
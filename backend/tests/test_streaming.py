@@ -0,0 +1,59 @@
+import asyncio
+
+import pytest
+
+from app.streaming import iter_json_array, iter_ndjson
+
+
+async def _chunks(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def collect(iterator_factory, chunks):
+    async def _collect():
+        return [row async for row in iterator_factory(_chunks(chunks))]
+    return asyncio.run(_collect())
+
+
+def test_json_array_elements_split_across_chunks():
+    chunks = [b'[{"word": "a', b'pple"}, ', b'"x", [1', b', 2]]']
+    assert collect(iter_json_array, chunks) == [{"word": "apple"}, "x", [1, 2]]
+
+
+@pytest.mark.parametrize("chunks", [
+    [b"[1.", b"5e1", b"0]"],
+    [b"[1", b".5e10", b"]"],
+    [b"[1.5e", b"10 ", b"]"],
+])
+def test_json_array_number_split_across_chunks(chunks):
+    assert collect(iter_json_array, chunks) == [1.5e10]
+
+
+def test_json_array_literal_split_across_chunks():
+    assert collect(iter_json_array, [b"[tr", b"ue, nu", b"ll, 12", b"3]"]) == [True, None, 123]
+
+
+@pytest.mark.parametrize("chunks", [
+    [b"[1] x"],
+    [b"[1]", b" x"],
+    [b"[1]\n", b"  ", b"[2]"],
+])
+def test_json_array_rejects_data_after_the_array(chunks):
+    with pytest.raises(ValueError, match="after JSON array"):
+        collect(iter_json_array, chunks)
+
+
+def test_json_array_accepts_trailing_whitespace_in_later_chunks():
+    assert collect(iter_json_array, [b"[1]", b" \n", b"\t"]) == [1]
+
+
+@pytest.mark.parametrize("chunks", [[b"[1,]"], [b"[1 2]"], [b"[1"], [b"{}"], [b"[1x]"]])
+def test_json_array_rejects_malformed_arrays(chunks):
+    with pytest.raises(ValueError):
+        collect(iter_json_array, chunks)
+
+
+def test_ndjson_lines_split_across_chunks():
+    chunks = [b'{"a": 1}\n{"a"', b': 2}\n\n', b'{"a": 3}']
+    assert collect(iter_ndjson, chunks) == [b'{"a": 1}', b'{"a": 2}', b'{"a": 3}']
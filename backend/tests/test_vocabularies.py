@@ -0,0 +1,59 @@
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import mysql, postgresql
+
+from app import models
+from app.main import on_conflict_insert
+
+pytestmark = pytest.mark.anyio
+
+
+def bound_to(dialect):
+    return SimpleNamespace(bind=SimpleNamespace(dialect=dialect))
+
+
+async def test_create_vocabulary_returns_existing_word(client, auth_headers):
+    response = await client.post("/vocabularies/", json={"word": "Haus", "meaning": "house"}, headers=auth_headers)
+    assert response.status_code == 201
+    created = response.json()
+
+    response = await client.post("/vocabularies/", json={"word": " haus ", "meaning": "home"}, headers=auth_headers)
+    assert response.status_code == 200
+    assert response.json() == created
+
+
+async def test_bulk_insert_resolves_repeated_words(client, auth_headers):
+    existing = (await client.post("/vocabularies/", json={"word": "Baum", "meaning": "tree"}, headers=auth_headers)).json()
+    rows = [{"word": "Hund", "meaning": "dog"}, {"word": "HUND", "meaning": "dog"}, {"word": "baum", "meaning": "tree"}]
+
+    response = await client.post("/vocabularies/bulk", json=rows, headers=auth_headers)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["created"], body["existing"], body["failed"]) == (1, 2, 0)
+    results = body["results"]
+    assert [result["existing"] for result in results] == [False, True, True]
+    assert results[0]["id"] == results[1]["id"]
+    assert results[2]["id"] == existing["id"]
+
+
+async def test_blank_words_are_rejected(client, auth_headers):
+    for word in ("", "   ", "\t\n"):
+        response = await client.post("/vocabularies/", json={"word": word, "meaning": "nothing"}, headers=auth_headers)
+        assert response.status_code == 422
+
+    rows = [{"word": " ", "meaning": "nothing"}, {"word": "Haus", "meaning": "house"}, {"word": "", "meaning": "nothing"}]
+    response = await client.post("/vocabularies/bulk", json=rows, headers=auth_headers)
+    body = response.json()
+    assert (body["created"], body["existing"], body["failed"]) == (1, 0, 2)
+    assert [result["error"] is not None for result in body["results"]] == [True, False, True]
+
+
+def test_on_conflict_insert_follows_the_dialect():
+    statement = on_conflict_insert(bound_to(postgresql.dialect()), models.Vocabulary).on_conflict_do_nothing(
+        index_elements=[models.Vocabulary.normalized_word]
+    )
+    assert "ON CONFLICT (normalized_word) DO NOTHING" in str(statement.compile(dialect=postgresql.dialect()))
+
+    with pytest.raises(NotImplementedError):
+        on_conflict_insert(bound_to(mysql.dialect()), models.Vocabulary)
@@ -39,23 +39,54 @@ const DEFAULT_SETTINGS = {
     });
   }
   
+  // Last associations fetched and the ETag their first page came with
+  let associationsETag = null;
+  let cachedAssociations = null;
+  // Largest page the API serves
+  const ASSOCIATIONS_PAGE_SIZE = 200;
+
   // Fetch vocabulary data from API
   async function fetchVocabularyData() {
     try {
       console.log("Fetching vocabulary data from API...");
-      const response = await fetch(`${API_BASE_URL}associations/`, {
+      const headers = {
+        'Authorization': `Bearer ${API_TOKEN}`,
+        'Content-Type': 'application/json'
+      };
+      if (associationsETag && cachedAssociations) {
+        headers['If-None-Match'] = associationsETag;
+      }
+      const pageUrl = (cursor) => `${API_BASE_URL}associations/?limit=${ASSOCIATIONS_PAGE_SIZE}` +
+        (cursor === null ? '' : `&cursor=${cursor}`);
+      const response = await fetch(pageUrl(null), {
         method: 'GET',
-        headers: {
-          'Authorization': `Bearer ${API_TOKEN}`,
-          'Content-Type': 'application/json'
-        }
+        headers
       });
       
+      // Every page shares one version, an unchanged first page means nothing changed
+      if (response.status === 304 && cachedAssociations) {
+        console.log("Vocabulary data not modified, using cached copy");
+        return cachedAssociations;
+      }
+
       if (!response.ok) {
         throw new Error(`API request failed with status ${response.status}`);
       }
       
-      const data = await response.json();
+      let { items: data, next_cursor: nextCursor } = await response.json();
+      // Follow the cursor so users with more than one page are quizzed on all of them
+      while (nextCursor !== null && nextCursor !== undefined) {
+        const pageResponse = await fetch(pageUrl(nextCursor), {
+          method: 'GET',
+          headers: { 'Authorization': headers['Authorization'], 'Content-Type': 'application/json' }
+        });
+        if (!pageResponse.ok) {
+          throw new Error(`API request failed with status ${pageResponse.status}`);
+        }
+        const page = await pageResponse.json();
+        data = data.concat(page.items);
+        nextCursor = page.next_cursor;
+      }
       // Filter out items with no options and ensure only those with status 'correct'
       const validData = data.filter(item => 
         item.options && 
@@ -63,6 +94,8 @@ const DEFAULT_SETTINGS = {
         item.status === 'pending'
       );
       console.log("Fetched vocabulary data:", validData);
+      associationsETag = response.headers.get('ETag');
+      cachedAssociations = validData;
       return validData;
     } catch (error) {
       console.error("Error fetching vocabulary data:", error);
@@ -77,13 +77,48 @@ async def create_association_in_fastapi(vocabulary_id: int, session: aiohttp.Cli
         }
 
 
+async def create_associations_batch_in_fastapi(vocabulary_ids: list, session: aiohttp.ClientSession):
+    """
+    Calls the FastAPI batch endpoint to create associations for many vocabularies
+    in one request. Failures are reported per vocabulary in the response body.
+    """
+    if not FASTAPI_BASE_URL or not API_AUTH_TOKEN:
+        return {"error": "Lambda configuration missing (URL or Token)", "statusCode": 500}
+
+    url = f"{FASTAPI_BASE_URL}/associations/batch"
+    payload = {'vocabulary_ids': vocabulary_ids}
+    headers = {
+        'Authorization': f'Bearer {API_AUTH_TOKEN}', 
+        'Content-Type': 'application/json'
+    }
+
+    logger.info(f"Calling POST {url} with {len(vocabulary_ids)} vocabulary ids")
+    async with session.post(url, json=payload, headers=headers) as response:
+        response_text = await response.text()
+        logger.info(f"FastAPI POST Association batch response status: {response.status}, body: {response_text}")
+        try:
+            response_json = json.loads(response_text)
+        except json.JSONDecodeError:
+            response_json = {"raw_response": response_text}
+        
+        return {
+            "statusCode": response.status,
+            "body": response_json
+        }
+
+
 async def main(event_body):
     try:
+        vocabulary_ids = event_body.get('vocabulary_ids')
+        if vocabulary_ids:
+            async with aiohttp.ClientSession() as session:
+                return await create_associations_batch_in_fastapi(vocabulary_ids=vocabulary_ids, session=session)
+
         vocabulary_id = event_body.get('vocabulary_id')
         if vocabulary_id is None: # Check for None explicitly as 0 could be a valid ID
             return {
                 "statusCode": 400,
-                "body": json.dumps({"error": "Missing 'vocabulary_id' in request body"})
+                "body": json.dumps({"error": "Missing 'vocabulary_id' or 'vocabulary_ids' in request body"})
             }
         
         async with aiohttp.ClientSession() as session: